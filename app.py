@@ -4,13 +4,21 @@ Entry point and main window configuration.
 """
 
 import customtkinter as ctk
+import importlib
+import threading
 from components.sidebar import Sidebar
 from pages.home import HomePage
-from pages.library import LibraryPage
-from pages.store import StorePage
-from pages.reader import ReaderPage
 import database
 
+# Pages created on first navigation: page id -> (module, class name)
+_LAZY_PAGES = {
+    "library": ("pages.library", "LibraryPage"),
+    "store": ("pages.store", "StorePage"),
+}
+
+# Delay before importing the remaining pages in the background
+PREWARM_DELAY_MS = 500
+
 
 class AppleBooksApp(ctk.CTk):
     """Main application window."""
@@ -38,6 +46,9 @@ class AppleBooksApp(ctk.CTk):
         
         # Show home page by default
         self._navigate("home")
+        
+        # Import the other pages off the startup path once the window is up
+        self.after(PREWARM_DELAY_MS, self._prewarm_pages)
     
     def _create_layout(self):
         """Create the main application layout."""
@@ -61,18 +72,33 @@ class AppleBooksApp(ctk.CTk):
         self.pages = {}
         self._create_pages()
         
-        # Reader page (overlay - not in pages dict initially)
-        self.reader_page = ReaderPage(self, on_back=self._close_reader)
+        # Reader page (overlay - not in pages dict, created on first open)
+        self.reader_page = None
     
     def _create_pages(self):
-        """Create all application pages."""
+        """Create the home page; other pages are created on first visit."""
         self.pages["home"] = HomePage(self.content_area, on_open_book=self._open_book)
-        self.pages["library"] = LibraryPage(self.content_area, on_open_book=self._open_book)
-        self.pages["store"] = StorePage(self.content_area, on_import_complete=self._on_import)
+        self.pages["home"].pack_forget()
+    
+    def _get_page(self, page_id: str):
+        """Get a page, importing and creating it on first use."""
+        if page_id not in self.pages and page_id in _LAZY_PAGES:
+            module_name, class_name = _LAZY_PAGES[page_id]
+            page_class = getattr(importlib.import_module(module_name), class_name)
+            if page_id == "store":
+                page = page_class(self.content_area, on_import_complete=self._on_import)
+            else:
+                page = page_class(self.content_area, on_open_book=self._open_book)
+            self.pages[page_id] = page
+        return self.pages.get(page_id)
+    
+    def _prewarm_pages(self):
+        """Import the heavier page modules in the background."""
+        def import_pages():
+            for module_name in ("pages.library", "pages.store", "pages.reader"):
+                importlib.import_module(module_name)
         
-        # Hide all pages initially
-        for page in self.pages.values():
-            page.pack_forget()
+        threading.Thread(target=import_pages, daemon=True).start()
     
     def _navigate(self, page_id: str):
         """Navigate to a page."""
@@ -86,12 +112,13 @@ class AppleBooksApp(ctk.CTk):
             page.pack_forget()
         
         # Show requested page
-        if page_id in self.pages:
-            self.pages[page_id].pack(fill="both", expand=True)
+        page = self._get_page(page_id)
+        if page is not None:
+            page.pack(fill="both", expand=True)
             
             # Refresh page content
-            if hasattr(self.pages[page_id], 'refresh'):
-                self.pages[page_id].refresh()
+            if hasattr(page, 'refresh'):
+                page.refresh()
     
     def _show_collection(self, collection_id: str):
         """Show a collection view."""
@@ -103,6 +130,10 @@ class AppleBooksApp(ctk.CTk):
     
     def _open_book(self, book_data: dict):
         """Open a book in the reader."""
+        if self.reader_page is None:
+            from pages.reader import ReaderPage
+            self.reader_page = ReaderPage(self, on_back=self._close_reader)
+        
         # Hide main container completely
         self.main_container.pack_forget()
         
@@ -29,10 +29,9 @@ hidden_imports = [
     # PyMuPDF
     'fitz',
     
-    # BeautifulSoup
-    'bs4',
+    # lxml (EPUB document parsing)
     'lxml',
-    'html.parser',
+    'lxml.html',
     
     # Standard library modules that might be missed
     'sqlite3',
@@ -5,25 +5,147 @@ Reusable book cover card with hover effects.
 
 import customtkinter as ctk
 from PIL import Image, ImageTk, ImageDraw, ImageFilter
+from functools import lru_cache
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 import io
+import os
+import database
+from components.thumb_cache import get_thumb, put_thumb
+from components.cover_cache import get_pdf_cover
+from components.fonts import font, fit_text
+
+# Worker pool for cover decoding (Pillow releases the GIL while resizing)
+_IMG_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
+# How often a card checks whether its cover has finished loading
+COVER_POLL_MS = 16
+
+# Bind tag shared by every widget inside a card, so hover/click handlers
+# are registered once instead of on each child widget of each card
+_CARD_BINDTAG = "BookCard"
+
+# Resampling filter per card size: bilinear is indistinguishable from
+# Lanczos at thumbnail sizes and much cheaper, so Lanczos is kept for "large"
+_COVER_FILTERS = {
+    "small": Image.Resampling.BILINEAR,
+    "medium": Image.Resampling.BILINEAR,
+    "large": Image.Resampling.LANCZOS,
+}
+
+# Corner radius of cover images, matching the cover frame's rounding
+COVER_RADIUS = 6
+
+
+@lru_cache(maxsize=8)
+def _rounded_mask(size: tuple, radius: int = COVER_RADIUS) -> Image.Image:
+    """Build the rounded-corner alpha mask once per cover size."""
+    mask = Image.new("L", size, 0)
+    draw = ImageDraw.Draw(mask)
+    draw.rounded_rectangle([(0, 0), size], radius=radius, fill=255)
+    return mask
+
+
+# Gradient color pairs for placeholder covers
+_PLACEHOLDER_COLORS = [
+    ("#FF6B6B", "#EE5A24"),
+    ("#74B9FF", "#0984E3"),
+    ("#55EFC4", "#00B894"),
+    ("#FFEAA7", "#FDCB6E"),
+    ("#DFE6E9", "#B2BEC3"),
+    ("#A29BFE", "#6C5CE7"),
+]
+
+
+def _title_color(title: str) -> int:
+    """Pick a placeholder color index from a stable FNV-1a hash of the title."""
+    h = 2166136261
+    for b in title.encode("utf-8"):
+        h = ((h ^ b) * 16777619) & 0xFFFFFFFF
+    return h % len(_PLACEHOLDER_COLORS)
+
+
+def _hex_to_rgb(color: str) -> tuple:
+    """Convert a #RRGGBB color string to an RGB tuple."""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+@lru_cache(maxsize=64)
+def _placeholder_image(color_idx: int, width: int, height: int) -> ctk.CTkImage:
+    """Render a gradient placeholder cover once per color and size."""
+    start_color, end_color = _PLACEHOLDER_COLORS[color_idx]
+    start, end = _hex_to_rgb(start_color), _hex_to_rgb(end_color)
+    
+    # Blend the two colors through a vertical ramp entirely in Pillow's C code
+    ramp = Image.linear_gradient("L").resize((width, height), Image.Resampling.BILINEAR)
+    image = Image.composite(
+        Image.new("RGB", (width, height), end),
+        Image.new("RGB", (width, height), start),
+        ramp
+    )
+    
+    image.putalpha(_rounded_mask((width, height)))
+    
+    return ctk.CTkImage(light_image=image, dark_image=image, size=(width, height))
+
+
+def _load_cover(book_id: int, image_data: bytes, size: tuple,
+                resample: int = Image.Resampling.LANCZOS,
+                pdf_path: str = None, file_path: str = None) -> Optional[Image.Image]:
+    """Load a resized, rounded cover, or None if the book has none. Runs on a worker thread."""
+    # Reuse the resized thumbnail from disk when available
+    image = get_thumb(file_path, size) if file_path else None
+    
+    if image is None:
+        if image_data is None and book_id is not None:
+            image_data = database.get_cover(book_id)
+        if image_data is None and pdf_path:
+            # PDFs are imported without a cover; it is rendered on first display
+            image_data = get_pdf_cover(pdf_path)
+        if image_data is None:
+            return None
+        image = Image.open(io.BytesIO(image_data))
+        
+        # Let JPEG decode at a reduced scale, then box-reduce before the
+        # final filter pass so large covers are not filtered at full size
+        image.draft("RGB", size)
+        image = image.resize(size, resample, reducing_gap=2.0)
+        
+        # Add rounded corners
+        image.putalpha(_rounded_mask(size))
+        
+        if file_path:
+            put_thumb(file_path, size, image)
+    
+    return image
 
 
 class BookCard(ctk.CTkFrame):
     """A book cover card with Apple-style design."""
     
+    # Whether the shared card bindings have been registered with Tk
+    _events_bound = False
+    
     def __init__(self, parent, book_data: dict, on_click=None, size="medium"):
         super().__init__(parent, fg_color="transparent")
         
         self.book_data = book_data
         self.on_click = on_click
         
+        # Pending background cover load
+        self._cover_future = None
+        self._cover_job = None
+        
         # Size configurations
         sizes = {
             "small": (100, 150),
             "medium": (140, 210),
             "large": (180, 270)
         }
-        self.width, self.height = sizes.get(size, sizes["medium"])
+        if size not in sizes:
+            size = "medium"
+        self.card_size = size
+        self.width, self.height = sizes[size]
         
         self._create_widgets()
         self._bind_events()
@@ -44,125 +166,188 @@ class BookCard(ctk.CTkFrame):
         self.cover_frame.pack_propagate(False)
         
         # Cover image or placeholder
-        if self.book_data.get("cover_image"):
-            self._set_cover_image(self.book_data["cover_image"])
-        else:
-            self._create_placeholder_cover()
+        self.cover_label = ctk.CTkLabel(
+            self.cover_frame,
+            text="",
+            compound="center",
+            font=font(24),
+            text_color=("#1D1D1F", "#1D1D1F")
+        )
+        self.cover_label.pack(expand=True)
         
         # Book title
-        title = self.book_data.get("title", "Unknown Title")
-        if len(title) > 20:
-            title = title[:18] + "..."
-        
         self.title_label = ctk.CTkLabel(
             self,
-            text=title,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            text="",
+            font=font(13, "bold"),
             text_color=("#1D1D1F", "#F5F5F7"),
             wraplength=self.width
         )
         self.title_label.pack(anchor="w")
         
         # Author
-        author = self.book_data.get("author", "Unknown Author")
-        if len(author) > 22:
-            author = author[:20] + "..."
-        
         self.author_label = ctk.CTkLabel(
             self,
-            text=author,
-            font=ctk.CTkFont(size=11),
+            text="",
+            font=font(11),
             text_color=("#86868B", "#86868B")
         )
         self.author_label.pack(anchor="w")
         
+        # Progress bar (created on first book being read)
+        self.progress_bar = None
+        
+        self._show_book_data()
+    
+    def rebind(self, book_data: dict):
+        """Show a different book in this card, reusing its widgets."""
+        # Page refreshes mostly hand cards the book they already show
+        if book_data == self.book_data:
+            return
+        self._cancel_cover_load()
+        self.book_data = book_data
+        self._show_book_data()
+    
+    def _show_book_data(self):
+        """Fill the card widgets from book_data."""
+        # Cover image or placeholder (list queries only flag has_cover;
+        # the BLOB itself is loaded on demand)
+        self._show_placeholder_cover()
+        if (self.book_data.get("has_cover") or self.book_data.get("cover_image")
+                or self._pdf_path()):
+            self._set_cover_image()
+        
+        # Book title and author, truncated to the card width
+        title = self.book_data.get("title", "Unknown Title")
+        self.title_label.configure(text=fit_text(title, font(13, "bold"), self.width))
+        
+        author = self.book_data.get("author", "Unknown Author")
+        self.author_label.configure(text=fit_text(author, font(11), self.width))
+        
         # Progress bar (if reading)
         progress = self.book_data.get("progress", 0)
         if progress > 0:
-            self.progress_bar = ctk.CTkProgressBar(
-                self,
-                width=self.width,
-                height=4,
-                corner_radius=2,
-                progress_color=("#007AFF", "#0A84FF")
-            )
+            if self.progress_bar is None:
+                self.progress_bar = ctk.CTkProgressBar(
+                    self,
+                    width=self.width,
+                    height=4,
+                    corner_radius=2,
+                    progress_color=("#007AFF", "#0A84FF")
+                )
+                # Created after _bind_events tagged the other widgets
+                BookCard._add_bindtag(self.progress_bar)
             self.progress_bar.pack(pady=(6, 0))
             self.progress_bar.set(progress / 100)
+        elif self.progress_bar is not None:
+            self.progress_bar.pack_forget()
+    
+    def _pdf_path(self) -> Optional[str]:
+        """Get the book's file path if it is a PDF (whose cover can be rendered)."""
+        if self.book_data.get("file_type", "").lower() == "pdf":
+            return self.book_data.get("file_path")
+        return None
+    
+    def _set_cover_image(self):
+        """Load the real cover in the background."""
+        size = (self.width - 4, self.height - 4)
+        self._cover_future = _IMG_POOL.submit(
+            _load_cover,
+            self.book_data.get("id"),
+            self.book_data.get("cover_image"),
+            size,
+            _COVER_FILTERS[self.card_size],
+            self._pdf_path(),
+            self.book_data.get("file_path")
+        )
+        self._cover_job = self.after(COVER_POLL_MS, self._poll_cover)
     
-    def _set_cover_image(self, image_data: bytes):
-        """Set cover image from bytes."""
+    def _poll_cover(self):
+        """Attach the cover once the worker has finished (Tk thread only)."""
+        future = self._cover_future
+        if not future.done():
+            self._cover_job = self.after(COVER_POLL_MS, self._poll_cover)
+            return
+        
+        self._cover_job = None
+        self._cover_future = None
         try:
-            image = Image.open(io.BytesIO(image_data))
-            image = image.resize((self.width - 4, self.height - 4), Image.Resampling.LANCZOS)
-            
-            # Add rounded corners
-            mask = Image.new("L", image.size, 0)
-            draw = ImageDraw.Draw(mask)
-            draw.rounded_rectangle([(0, 0), image.size], radius=6, fill=255)
-            
-            image.putalpha(mask)
-            
-            self.cover_photo = ctk.CTkImage(
-                light_image=image,
-                dark_image=image,
-                size=(self.width - 4, self.height - 4)
-            )
-            
-            self.cover_label = ctk.CTkLabel(
-                self.cover_frame,
-                image=self.cover_photo,
-                text=""
-            )
-            self.cover_label.pack(expand=True)
+            image = future.result()
         except Exception:
-            self._create_placeholder_cover()
-    
-    def _create_placeholder_cover(self):
-        """Create a placeholder cover with gradient."""
-        # Create gradient placeholder
-        colors = [
-            ("#FF6B6B", "#EE5A24"),
-            ("#74B9FF", "#0984E3"),
-            ("#55EFC4", "#00B894"),
-            ("#FFEAA7", "#FDCB6E"),
-            ("#DFE6E9", "#B2BEC3"),
-            ("#A29BFE", "#6C5CE7"),
-        ]
-        
+            return  # Keep the placeholder
+        if image is not None:
+            self._attach_image(image)
+    
+    def _attach_image(self, image: Image.Image):
+        """Replace the placeholder with a decoded cover image."""
+        self.cover_photo = ctk.CTkImage(
+            light_image=image,
+            dark_image=image,
+            size=(self.width - 4, self.height - 4)
+        )
+        self.cover_label.configure(image=self.cover_photo, text="")
+    
+    def _show_placeholder_cover(self):
+        """Show a placeholder cover with gradient."""
         # Pick color based on title hash
         title = self.book_data.get("title", "Book")
-        color_idx = hash(title) % len(colors)
-        start_color, end_color = colors[color_idx]
+        color_idx = _title_color(title)
         
         # File type icon
         file_type = self.book_data.get("file_type", "epub").upper()
         icon = "📖" if file_type == "EPUB" else "📄"
         
-        self.cover_label = ctk.CTkLabel(
-            self.cover_frame,
-            text=f"{icon}\n\n{file_type}",
-            font=ctk.CTkFont(size=24),
-            text_color=("#1D1D1F", "#F5F5F7")
-        )
-        self.cover_label.pack(expand=True)
+        self.cover_photo = _placeholder_image(color_idx, self.width - 4, self.height - 4)
+        self.cover_label.configure(image=self.cover_photo, text=f"{icon}\n\n{file_type}")
+    
+    def _cancel_cover_load(self):
+        """Cancel any pending background cover load."""
+        if self._cover_job is not None:
+            self.after_cancel(self._cover_job)
+            self._cover_job = None
+        if self._cover_future is not None:
+            self._cover_future.cancel()
+            self._cover_future = None
+    
+    def destroy(self):
+        """Cancel any pending cover load before destroying the card."""
+        self._cancel_cover_load()
+        super().destroy()
     
     def _bind_events(self):
-        """Bind hover and click events to all widgets."""
-        widgets = [self, self.cover_frame, self.title_label, self.author_label]
-        
-        # Add cover label if it exists
-        if hasattr(self, 'cover_label'):
-            widgets.append(self.cover_label)
-        
-        # Also bind to all children of cover_frame
-        for child in self.cover_frame.winfo_children():
-            if child not in widgets:
-                widgets.append(child)
-        
-        for widget in widgets:
-            widget.bind("<Enter>", self._on_enter)
-            widget.bind("<Leave>", self._on_leave)
-            widget.bind("<Button-1>", self._on_click)
+        """Route hover and click events from all card widgets to the card."""
+        if not BookCard._events_bound:
+            handlers = [
+                ("<Enter>", BookCard._on_enter),
+                ("<Leave>", BookCard._on_leave),
+                ("<Button-1>", BookCard._on_click),
+            ]
+            for sequence, handler in handlers:
+                self.bind_class(
+                    _CARD_BINDTAG,
+                    sequence,
+                    lambda event, h=handler: BookCard._dispatch_event(event, h)
+                )
+            BookCard._events_bound = True
+        
+        self._add_bindtag(self)
+    
+    @staticmethod
+    def _add_bindtag(widget):
+        """Tag a widget and all its descendants with the card bind tag."""
+        if _CARD_BINDTAG not in widget.bindtags():
+            widget.bindtags((_CARD_BINDTAG,) + widget.bindtags())
+        for child in widget.winfo_children():
+            BookCard._add_bindtag(child)
+    
+    @staticmethod
+    def _dispatch_event(event, handler):
+        """Call a card handler for the card that owns the event widget."""
+        widget = event.widget
+        while widget is not None and not isinstance(widget, BookCard):
+            widget = getattr(widget, "master", None)
+        if widget is not None:
+            handler(widget, event)
     
     def _on_enter(self, event):
         """Handle mouse enter."""
@@ -0,0 +1,54 @@
+"""
+Apple Books Clone - Content Cache
+Disk cache for parsed EPUB content, so reopening a book skips parsing it.
+"""
+
+import os
+import pickle
+import hashlib
+import zlib
+from typing import Optional
+
+CONTENT_DIR = os.path.join(os.path.expanduser("~"), ".booker", "content")
+
+# Bump when the cached content format changes, so old entries are ignored
+CONTENT_VERSION = 4
+
+
+def _content_path(file_path: str) -> str:
+    """Get the cache file path for a book."""
+    digest = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+    return os.path.join(CONTENT_DIR, f"{digest}.pkl.z")
+
+
+def _stamp(file_path: str) -> tuple:
+    """Identify the current version of a book file."""
+    stat = os.stat(file_path)
+    return (CONTENT_VERSION, stat.st_mtime_ns, stat.st_size)
+
+
+def get_content(file_path: str) -> Optional[dict]:
+    """Load cached content for a book, or None if it is missing or stale."""
+    try:
+        with open(_content_path(file_path), "rb") as f:
+            stamp, content = pickle.loads(zlib.decompress(f.read()))
+        if stamp != _stamp(file_path):
+            return None
+        return content
+    except Exception:
+        return None
+
+
+def put_content(file_path: str, content: dict):
+    """Store parsed content for a book on disk."""
+    path = _content_path(file_path)
+    tmp_path = f"{path}.tmp"
+    try:
+        data = zlib.compress(pickle.dumps((_stamp(file_path), content), pickle.HIGHEST_PROTOCOL))
+        os.makedirs(CONTENT_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        # Atomic replace so a half-written file is never read back
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Cache is best-effort
@@ -0,0 +1,59 @@
+"""
+Apple Books Clone - Cover Cache
+Disk cache for PDF covers, rendered from the first page when first shown.
+"""
+
+import os
+import hashlib
+import threading
+from typing import Optional
+
+COVER_DIR = os.path.join(os.path.expanduser("~"), ".booker", "covers")
+
+# Scale of the first-page render used as a PDF's cover
+COVER_SCALE = 0.5
+
+# JPEG quality of rendered covers; thumbnails are resized from them
+COVER_QUALITY = 75
+
+# PyMuPDF is not thread-safe, and covers are loaded on a worker pool
+_render_lock = threading.Lock()
+
+
+def _cover_path(file_path: str) -> str:
+    """Get the cache file path for a PDF's cover."""
+    stat = os.stat(file_path)
+    book_key = f"{os.path.abspath(file_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    digest = hashlib.sha1(book_key.encode("utf-8")).hexdigest()
+    return os.path.join(COVER_DIR, f"{digest}.jpg")
+
+
+def get_pdf_cover(file_path: str) -> Optional[bytes]:
+    """Get a PDF's cover as JPEG bytes, rendering its first page on first use."""
+    path = _cover_path(file_path)
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        pass
+    
+    # Imported here so showing the library doesn't load PyMuPDF up front
+    import fitz
+    
+    with _render_lock:
+        with fitz.open(file_path) as doc:
+            if doc.page_count == 0:
+                return None
+            pix = doc[0].get_pixmap(matrix=fitz.Matrix(COVER_SCALE, COVER_SCALE), alpha=False)
+            data = pix.tobytes("jpeg", jpg_quality=COVER_QUALITY)
+    
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(COVER_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        # Atomic replace so a half-written file is never read back
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Cache is best-effort
+    return data
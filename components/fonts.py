@@ -0,0 +1,31 @@
+"""
+Apple Books Clone - Fonts
+Shared font objects, so widgets don't each allocate their own Tk font.
+"""
+
+import customtkinter as ctk
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def font(size: int, weight: str = "normal", family: str = None) -> ctk.CTkFont:
+    """Get a shared CTkFont for the given size, weight and family."""
+    if family:
+        return ctk.CTkFont(family=family, size=size, weight=weight)
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+def fit_text(text: str, text_font: ctk.CTkFont, max_px: int) -> str:
+    """Truncate text with an ellipsis so it fits within max_px when drawn in text_font."""
+    if text_font.measure(text) <= max_px:
+        return text
+    
+    # Binary search for the longest prefix that fits with the ellipsis
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if text_font.measure(text[:mid] + "…") <= max_px:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + "…"
@@ -0,0 +1,71 @@
+"""
+Apple Books Clone - Page Cache
+Disk cache for rendered PDF pages, so reopened books skip re-rendering.
+"""
+
+import os
+import hashlib
+from typing import Optional, Tuple
+from PIL import Image
+
+PAGE_DIR = os.path.join(os.path.expanduser("~"), ".booker", "pages")
+
+# Least recently used pages are deleted once the cache grows past this
+PAGE_CACHE_LIMIT = 500 * 1024 * 1024
+
+# WebP quality for cached pages; high enough that text stays crisp
+PAGE_QUALITY = 90
+
+
+def _page_path(file_path: str, page_num: int, box: Tuple[int, int]) -> str:
+    """Get the cache file path for a page rendered to fit a box."""
+    stat = os.stat(file_path)
+    book_key = f"{os.path.abspath(file_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    digest = hashlib.sha1(book_key.encode("utf-8")).hexdigest()
+    width, height = box
+    return os.path.join(PAGE_DIR, f"{digest}_{page_num}_{width}x{height}.webp")
+
+
+def get_page(file_path: str, page_num: int, box: Tuple[int, int]) -> Optional[Image.Image]:
+    """Load a cached page render, or None if it has not been rendered yet."""
+    try:
+        path = _page_path(file_path, page_num, box)
+        with Image.open(path) as image:
+            image.load()
+        # Mark as recently used for pruning
+        os.utime(path)
+        return image
+    except Exception:
+        return None
+
+
+def put_page(file_path: str, page_num: int, box: Tuple[int, int], image: Image.Image):
+    """Store a page render on disk."""
+    try:
+        path = _page_path(file_path, page_num, box)
+        tmp_path = f"{path}.tmp"
+        os.makedirs(PAGE_DIR, exist_ok=True)
+        image.save(tmp_path, "WEBP", quality=PAGE_QUALITY)
+        # Atomic replace so a half-written file is never read back
+        os.replace(tmp_path, path)
+    except Exception:
+        pass  # Cache is best-effort
+
+
+def prune():
+    """Delete the least recently used pages until the cache fits PAGE_CACHE_LIMIT."""
+    try:
+        entries = [entry for entry in os.scandir(PAGE_DIR) if entry.is_file()]
+    except OSError:
+        return
+    
+    stats = [(entry.stat(), entry.path) for entry in entries]
+    total = sum(stat.st_size for stat, _ in stats)
+    for stat, path in sorted(stats, key=lambda item: item[0].st_mtime):
+        if total <= PAGE_CACHE_LIMIT:
+            break
+        try:
+            os.remove(path)
+            total -= stat.st_size
+        except OSError:
+            pass
@@ -4,6 +4,7 @@ Navigation sidebar with Apple-style design.
 """
 
 import customtkinter as ctk
+from components.fonts import font
 
 
 class Sidebar(ctk.CTkFrame):
@@ -29,7 +30,7 @@ class Sidebar(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             title_frame,
             text="📚 Books",
-            font=ctk.CTkFont(family="Segoe UI", size=24, weight="bold"),
+            font=font(24, "bold", "Segoe UI"),
             text_color=("#1D1D1F", "#F5F5F7")
         )
         title_label.pack(anchor="w")
@@ -38,7 +39,7 @@ class Sidebar(ctk.CTkFrame):
         nav_label = ctk.CTkLabel(
             self,
             text="Library",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=font(12, "bold"),
             text_color=("#86868B", "#86868B")
         )
         nav_label.pack(anchor="w", padx=20, pady=(0, 8))
@@ -61,7 +62,7 @@ class Sidebar(ctk.CTkFrame):
         collections_label = ctk.CTkLabel(
             self,
             text="Collections",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=font(12, "bold"),
             text_color=("#86868B", "#86868B")
         )
         collections_label.pack(anchor="w", padx=20, pady=(0, 8))
@@ -85,7 +86,7 @@ class Sidebar(ctk.CTkFrame):
         self.theme_switch = ctk.CTkSwitch(
             theme_frame,
             text="Dark Mode",
-            font=ctk.CTkFont(size=13),
+            font=font(13),
             command=self._toggle_theme,
             onvalue=1,
             offvalue=0
@@ -101,7 +102,7 @@ class Sidebar(ctk.CTkFrame):
         btn = ctk.CTkButton(
             self,
             text=f"  {icon}  {label}",
-            font=ctk.CTkFont(size=14),
+            font=font(14),
             anchor="w",
             height=38,
             corner_radius=8,
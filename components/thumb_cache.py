@@ -0,0 +1,61 @@
+"""
+Apple Books Clone - Thumbnail Cache
+Disk cache for resized book cover thumbnails.
+"""
+
+import os
+import glob
+import hashlib
+from typing import Optional, Tuple
+from PIL import Image
+
+THUMB_DIR = os.path.join(os.path.expanduser("~"), ".booker", "thumbs")
+
+
+def _book_digest(file_path: str) -> str:
+    """Get the file name prefix shared by all of a book's thumbnails."""
+    return hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+
+
+def _thumb_path(file_path: str, size: Tuple[int, int]) -> str:
+    """Get the cache file path for a book thumbnail."""
+    # Keyed on the book file rather than its database id, which is reused
+    # if the library is recreated
+    stat = os.stat(file_path)
+    width, height = size
+    return os.path.join(
+        THUMB_DIR,
+        f"{_book_digest(file_path)}_{stat.st_mtime_ns}_{stat.st_size}_{width}x{height}.png"
+    )
+
+
+def get_thumb(file_path: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+    """Load a cached thumbnail, or None if it has not been rendered yet."""
+    try:
+        with Image.open(_thumb_path(file_path, size)) as image:
+            image.load()
+            return image
+    except Exception:
+        return None
+
+
+def put_thumb(file_path: str, size: Tuple[int, int], image: Image.Image):
+    """Store a resized thumbnail on disk."""
+    try:
+        path = _thumb_path(file_path, size)
+        tmp_path = f"{path}.tmp"
+        os.makedirs(THUMB_DIR, exist_ok=True)
+        image.save(tmp_path, "PNG")
+        # Atomic replace so a half-written file is never read back
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Cache is best-effort
+
+
+def remove_thumbs(file_path: str):
+    """Delete every cached thumbnail of a book."""
+    for path in glob.glob(os.path.join(THUMB_DIR, f"{_book_digest(file_path)}_*")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,120 @@
+"""
+Apple Books Clone - Virtual Grid Component
+Card grid that only keeps widgets for the rows currently on screen.
+"""
+
+import customtkinter as ctk
+import tkinter as tk
+import math
+
+
+class VirtualGrid(ctk.CTkFrame):
+    """Card grid inside a scrollable frame, hydrated as rows scroll into view."""
+    
+    def __init__(self, parent, items: list, make_card, cols: int, card_size: tuple,
+                 pad: int = 10, overscan: int = 1):
+        super().__init__(parent, fg_color="transparent")
+        
+        self.items = items
+        self.make_card = make_card  # make_card(parent, item); cards must provide rebind(item)
+        self.cols = cols
+        self.pad = pad
+        self.overscan = overscan  # Extra rows kept above and below the viewport
+        self.cell_width = card_size[0] + 2 * pad
+        self.cell_height = card_size[1] + 2 * pad
+        
+        self._visible = {}  # item index -> card
+        self._free = []  # Cards waiting to be reused
+        self._update_job = None
+        
+        self._scroll_canvas = self._find_canvas()
+        if self._scroll_canvas is not None:
+            self._hook_scrolling()
+        self.bind("<Configure>", self._schedule_update, add="+")
+        self.bind("<Map>", self._schedule_update, add="+")
+        
+        self._resize()
+    
+    def _find_canvas(self):
+        """Find the canvas that scrolls this grid (the scrollable frame's canvas)."""
+        widget = self.master
+        while widget is not None and not isinstance(widget, tk.Canvas):
+            widget = getattr(widget, "master", None)
+        return widget
+    
+    def _hook_scrolling(self):
+        """Update visible rows whenever the canvas scrolls or resizes."""
+        scroll_command = str(self._scroll_canvas.cget("yscrollcommand"))
+        
+        def on_scroll(first, last):
+            if scroll_command:
+                self.tk.call(scroll_command, first, last)
+            self._schedule_update()
+        
+        self._scroll_canvas.configure(yscrollcommand=on_scroll)
+        self._scroll_canvas.bind("<Configure>", self._schedule_update, add="+")
+    
+    def set_items(self, items: list):
+        """Show a new list of items, keeping cards in place where possible."""
+        self.items = items
+        for index, card in list(self._visible.items()):
+            if index < len(items):
+                card.rebind(items[index])
+            else:
+                card.place_forget()
+                self._free.append(self._visible.pop(index))
+        
+        self._resize()
+        self._schedule_update()
+    
+    def _resize(self):
+        """Size the frame to hold every row, so the scrollbar spans the full list."""
+        rows = math.ceil(len(self.items) / self.cols)
+        self.configure(width=self.cols * self.cell_width, height=max(rows * self.cell_height, 1))
+    
+    def _schedule_update(self, event=None):
+        """Coalesce scroll and resize events into one update."""
+        if self._update_job is None:
+            self._update_job = self.after_idle(self._update_visible)
+    
+    def _update_visible(self):
+        """Hydrate cards for rows in the viewport and recycle the rest."""
+        self._update_job = None
+        if not self.items or not self.winfo_ismapped():
+            return
+        
+        # Visible region in grid coordinates (screen pixels)
+        if self._scroll_canvas is not None:
+            top = self._scroll_canvas.winfo_rooty() - self.winfo_rooty()
+            bottom = top + self._scroll_canvas.winfo_height()
+        else:
+            top, bottom = 0, self.winfo_height()
+        
+        row_height = self._apply_widget_scaling(self.cell_height)
+        rows = math.ceil(len(self.items) / self.cols)
+        first_row = max(0, int(top // row_height) - self.overscan)
+        last_row = min(rows - 1, int(bottom // row_height) + self.overscan)
+        
+        start = first_row * self.cols
+        end = min(len(self.items), (last_row + 1) * self.cols)
+        
+        # Return cards that scrolled out of range to the pool
+        for index in [i for i in self._visible if not start <= i < end]:
+            card = self._visible.pop(index)
+            card.place_forget()
+            self._free.append(card)
+        
+        # Fill the visible range, reusing pooled cards first
+        for index in range(start, end):
+            if index in self._visible:
+                continue
+            item = self.items[index]
+            if self._free:
+                card = self._free.pop()
+                card.rebind(item)
+            else:
+                card = self.make_card(self, item)
+            self._visible[index] = card
+            
+            row, col = divmod(index, self.cols)
+            card.place(x=col * self.cell_width + self.pad, y=row * self.cell_height + self.pad)
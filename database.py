@@ -5,102 +5,345 @@ Handles all SQLite database operations for books and collections.
 
 import sqlite3
 import os
+import atexit
+import threading
 from datetime import datetime
 from typing import List, Dict, Optional
 from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 
 DATABASE_PATH = os.path.join(os.path.dirname(__file__), "books.db")
 
-# Connection pool (simple singleton for SQLite)
-_connection = None
+# Applied once per connection: WAL lets readers run alongside a writer,
+# and the larger page cache (64 MB) / mmap keep hot pages out of read() syscalls
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA foreign_keys=ON;
+"""
+
+# Persistent connection per thread (SQLite caches prepared statements
+# and pages per connection, so reusing it keeps both warm)
+_local = threading.local()
+_all_connections = []
+_connections_lock = threading.Lock()
+
+# Whether the FTS5 title/author search index is available
+_fts_enabled = False
+
+# Schema setup only needs to run once per process
+_initialized = False
+
+# Stored in PRAGMA user_version; bump when _create_schema() changes
+_SCHEMA_VERSION = 3
+
+# Background thread for UI reads, so queries never block the Tk event loop.
+# One worker keeps queries in submission order on a single connection.
+_query_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="booker-db")
+
+# Columns for list views: only what the cards and reader use. Covers are
+# stored in book_covers and fetched per book with get_cover() only when
+# displayed; list rows just flag whether one exists.
+_BOOK_COLS = """
+    id, title, author, file_path, file_type, genre,
+    total_pages, current_page, progress, is_favorite, want_to_read,
+    finished, date_added, last_read,
+    EXISTS (SELECT 1 FROM book_covers WHERE book_id = books.id) AS has_cover
+"""
+
+# UPDATE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Results of list queries keyed on (sql, params), cleared by every write.
+# The generation counter stops a read that raced a write from caching
+# rows from before it.
+_query_cache = {}
+_cache_generation = 0
+_QUERY_CACHE_SIZE = 128
+
+
+def _open_connection() -> sqlite3.Connection:
+    """Open and configure a new database connection."""
+    conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_CONNECTION_PRAGMAS)
+    with _connections_lock:
+        _all_connections.append(conn)
+    return conn
 
 
 @contextmanager
 def get_connection():
-    """Get database connection with automatic cleanup."""
-    global _connection
-    if _connection is None:
-        _connection = sqlite3.connect(DATABASE_PATH, check_same_thread=False)
-        _connection.row_factory = sqlite3.Row
+    """Get this thread's database connection with rollback on error."""
+    conn = getattr(_local, "connection", None)
+    if conn is None:
+        conn = _open_connection()
+        _local.connection = conn
     try:
-        yield _connection
+        yield conn
     except Exception:
-        _connection.rollback()
+        conn.rollback()
         raise
 
 
+@atexit.register
+def close_connections():
+    """Close every open connection on shutdown."""
+    with _connections_lock:
+        for conn in _all_connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _all_connections.clear()
+
+
+class DictRow(sqlite3.Row):
+    """Read-only result row with dict-style get(), so rows can stand in for dicts."""
+    
+    def get(self, key: str, default=None):
+        """Get a column value, or default if the row has no such column."""
+        try:
+            return self[key]
+        except IndexError:
+            return default
+
+
+def _cached_query(sql: str, params: tuple = ()) -> List[DictRow]:
+    """Run a read query through the result cache."""
+    key = (sql, params)
+    rows = _query_cache.get(key)
+    if rows is None:
+        generation = _cache_generation
+        with get_connection() as conn:
+            cursor = conn.execute(sql, params)
+            cursor.row_factory = DictRow
+            rows = cursor.fetchall()
+        if generation == _cache_generation:
+            if len(_query_cache) >= _QUERY_CACHE_SIZE:
+                _query_cache.clear()
+            _query_cache[key] = rows
+    # Rows are immutable, so callers can share them; only the list is copied
+    return list(rows)
+
+
+def _invalidate_cache():
+    """Drop cached query results after a write."""
+    global _cache_generation
+    _cache_generation += 1
+    _query_cache.clear()
+
+
+def query_async(fn, *args) -> Future:
+    """Run a database function on the background query thread.
+    
+    The caller polls the returned future from the Tk thread, since Tk
+    must not be touched from the worker.
+    """
+    return _query_pool.submit(fn, *args)
+
+
 def init_database():
     """Initialize the database with required tables and indexes."""
+    global _initialized, _fts_enabled
+    if _initialized:
+        return
+    
     with get_connection() as conn:
         cursor = conn.cursor()
         
-        # Books table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS books (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                author TEXT DEFAULT 'Unknown',
-                file_path TEXT NOT NULL UNIQUE,
-                file_type TEXT NOT NULL,
-                cover_image BLOB,
-                description TEXT,
-                genre TEXT DEFAULT 'General',
-                total_pages INTEGER DEFAULT 0,
-                current_page INTEGER DEFAULT 0,
-                progress REAL DEFAULT 0.0,
-                is_favorite INTEGER DEFAULT 0,
-                want_to_read INTEGER DEFAULT 0,
-                finished INTEGER DEFAULT 0,
-                date_added TEXT NOT NULL,
-                last_read TEXT,
-                collection_id INTEGER,
-                FOREIGN KEY (collection_id) REFERENCES collections(id)
-            )
-        """)
+        # Tables, indexes and migrations only run when the stored schema
+        # version is behind this code, not on every startup
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] < _SCHEMA_VERSION:
+            _create_schema(cursor)
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
         
-        # Add indexes for frequently queried columns
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_date_added ON books(date_added DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_is_favorite ON books(is_favorite)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_progress ON books(progress)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_want_to_read ON books(want_to_read)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_finished ON books(finished)")
+        # Full-text index for title/author search
+        _fts_enabled = _create_search_index(cursor)
         
-        # Add new columns if they don't exist (migration)
-        try:
-            cursor.execute("ALTER TABLE books ADD COLUMN want_to_read INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        try:
-            cursor.execute("ALTER TABLE books ADD COLUMN finished INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+        # Without FTS5, search falls back to LIKE; case-insensitive indexes
+        # let prefix patterns use a B-tree range instead of a full scan
+        if not _fts_enabled:
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_title ON books(title COLLATE NOCASE)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_author ON books(author COLLATE NOCASE)")
         
-        # Collections table
+        conn.commit()
+        _initialized = True
+
+
+def _create_schema(cursor):
+    """Create or upgrade tables and indexes to _SCHEMA_VERSION."""
+    # Books table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS books (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            author TEXT DEFAULT 'Unknown',
+            file_path TEXT NOT NULL UNIQUE,
+            file_type TEXT NOT NULL,
+            description TEXT,
+            genre TEXT DEFAULT 'General',
+            total_pages INTEGER DEFAULT 0,
+            current_page INTEGER DEFAULT 0,
+            progress REAL DEFAULT 0.0,
+            is_favorite INTEGER DEFAULT 0,
+            want_to_read INTEGER DEFAULT 0,
+            finished INTEGER DEFAULT 0,
+            date_added TEXT NOT NULL,
+            last_read TEXT,
+            collection_id INTEGER,
+            FOREIGN KEY (collection_id) REFERENCES collections(id)
+        )
+    """)
+    
+    # Add new columns if they don't exist (migration)
+    try:
+        cursor.execute("ALTER TABLE books ADD COLUMN want_to_read INTEGER DEFAULT 0")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+    try:
+        cursor.execute("ALTER TABLE books ADD COLUMN finished INTEGER DEFAULT 0")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+    
+    # Add indexes for frequently queried columns
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_date_added ON books(date_added DESC)")
+    
+    # The 0/1 flag columns match about half the table, so plain indexes on
+    # them are never worth using and only slow down writes
+    cursor.execute("DROP INDEX IF EXISTS idx_books_is_favorite")
+    cursor.execute("DROP INDEX IF EXISTS idx_books_want_to_read")
+    cursor.execute("DROP INDEX IF EXISTS idx_books_finished")
+    
+    # Partial indexes matching the list query predicates and sort order
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_books_favorites ON books(title)
+        WHERE is_favorite = 1
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_books_want_to_read_added ON books(date_added DESC)
+        WHERE want_to_read = 1
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_books_finished_read ON books(last_read DESC)
+        WHERE finished = 1
+    """)
+    
+    # In-progress books ordered by last_read, so "Continue Reading" is
+    # served straight from the index without a sort step. This replaces
+    # the plain progress index, which the planner preferred even though
+    # it still needed a temp B-tree for the ORDER BY.
+    cursor.execute("DROP INDEX IF EXISTS idx_books_reading")
+    cursor.execute("DROP INDEX IF EXISTS idx_books_progress")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_books_reading_recent ON books(last_read DESC)
+        WHERE progress > 0 AND progress < 100
+    """)
+    
+    # Covers live in their own table, so the books B-tree stays small and
+    # list queries read densely packed pages
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS book_covers (
+            book_id INTEGER PRIMARY KEY REFERENCES books(id) ON DELETE CASCADE,
+            image BLOB NOT NULL
+        )
+    """)
+    
+    # Move covers stored inline by older versions into book_covers
+    cursor.execute("PRAGMA table_info(books)")
+    if any(column[1] == "cover_image" for column in cursor.fetchall()):
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS collections (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                icon TEXT DEFAULT '📚',
-                date_created TEXT NOT NULL
+            INSERT OR IGNORE INTO book_covers (book_id, image)
+            SELECT id, cover_image FROM books WHERE cover_image IS NOT NULL
+        """)
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            cursor.execute("ALTER TABLE books DROP COLUMN cover_image")
+        else:
+            cursor.execute("UPDATE books SET cover_image = NULL")  # No DROP COLUMN before 3.35
+    
+    # Collections table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS collections (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            icon TEXT DEFAULT '📚',
+            date_created TEXT NOT NULL
+        )
+    """)
+    
+    # Create default collections
+    default_collections = [
+        ("All Books", "📚"),
+        ("Want to Read", "📖"),
+        ("Currently Reading", "📕"),
+        ("Finished", "✅"),
+        ("Favorites", "❤️")
+    ]
+    
+    # Seed in one statement, and only until all defaults exist
+    cursor.execute("SELECT COUNT(*) FROM collections")
+    if cursor.fetchone()[0] < len(default_collections):
+        now = datetime.now().isoformat()
+        cursor.executemany("""
+            INSERT OR IGNORE INTO collections (name, icon, date_created)
+            VALUES (?, ?, ?)
+        """, [(name, icon, now) for name, icon in default_collections])
+
+
+def _create_search_index(cursor) -> bool:
+    """Create the FTS5 search index and its sync triggers.
+    
+    Returns False if this SQLite build does not include FTS5.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'books_fts'")
+    if cursor.fetchone():
+        return True
+    
+    try:
+        cursor.execute("""
+            CREATE VIRTUAL TABLE books_fts USING fts5(
+                title, author, content='books', content_rowid='id'
             )
         """)
-        
-        # Create default collections
-        default_collections = [
-            ("All Books", "📚"),
-            ("Want to Read", "📖"),
-            ("Currently Reading", "📕"),
-            ("Finished", "✅"),
-            ("Favorites", "❤️")
-        ]
-        
-        for name, icon in default_collections:
-            cursor.execute("""
-                INSERT OR IGNORE INTO collections (name, icon, date_created)
-                VALUES (?, ?, ?)
-            """, (name, icon, datetime.now().isoformat()))
-        
-        conn.commit()
+    except sqlite3.OperationalError:
+        return False  # FTS5 not compiled in
+    
+    # Keep the external-content index in sync with the books table
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS books_fts_insert AFTER INSERT ON books BEGIN
+            INSERT INTO books_fts(rowid, title, author)
+            VALUES (new.id, new.title, new.author);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS books_fts_delete AFTER DELETE ON books BEGIN
+            INSERT INTO books_fts(books_fts, rowid, title, author)
+            VALUES ('delete', old.id, old.title, old.author);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS books_fts_update AFTER UPDATE OF title, author ON books BEGIN
+            INSERT INTO books_fts(books_fts, rowid, title, author)
+            VALUES ('delete', old.id, old.title, old.author);
+            INSERT INTO books_fts(rowid, title, author)
+            VALUES (new.id, new.title, new.author);
+        END
+    """)
+    
+    # Index books that existed before the search table
+    cursor.execute("INSERT INTO books_fts(books_fts) VALUES ('rebuild')")
+    return True
+
+
+_INSERT_BOOK_SQL = """
+    INSERT {conflict} INTO books (title, author, file_path, file_type,
+                                  description, genre, total_pages, date_added)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 
 def add_book(title: str, author: str, file_path: str, file_type: str,
@@ -110,24 +353,69 @@ def add_book(title: str, author: str, file_path: str, file_type: str,
     with get_connection() as conn:
         cursor = conn.cursor()
         
-        cursor.execute("""
-            INSERT INTO books (title, author, file_path, file_type, cover_image,
-                              description, genre, total_pages, date_added)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (title, author, file_path, file_type, cover_image, description,
-              genre, total_pages, datetime.now().isoformat()))
+        cursor.execute(_INSERT_BOOK_SQL.format(conflict=""), (
+            title, author, file_path, file_type, description,
+            genre, total_pages, datetime.now().isoformat()))
         
         book_id = cursor.lastrowid
+        if cover_image:
+            cursor.execute("INSERT INTO book_covers (book_id, image) VALUES (?, ?)",
+                           (book_id, cover_image))
         conn.commit()
+        _invalidate_cache()
         return book_id
 
 
-def get_all_books() -> List[Dict]:
-    """Get all books from the database."""
+def add_books_bulk(books: List[tuple]) -> int:
+    """Add many books in a single transaction.
+    
+    Each row is (title, author, file_path, file_type, cover_image,
+    description, genre, total_pages). Files already in the library are
+    skipped. Returns the number of books added.
+    """
+    date_added = datetime.now().isoformat()
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM books ORDER BY date_added DESC")
-        return [dict(row) for row in cursor.fetchall()]
+        cursor.executemany(_INSERT_BOOK_SQL.format(conflict="OR IGNORE"), [
+            (title, author, file_path, file_type, description, genre, total_pages, date_added)
+            for title, author, file_path, file_type, _, description, genre, total_pages in books
+        ])
+        added = cursor.rowcount
+        
+        # Covers are keyed by book id, looked up by the unique file path
+        cursor.executemany("""
+            INSERT OR IGNORE INTO book_covers (book_id, image)
+            SELECT id, ? FROM books WHERE file_path = ?
+        """, [(book[4], book[2]) for book in books if book[4]])
+        
+        conn.commit()
+        _invalidate_cache()
+        return added
+
+
+# SQLite's default cap on bound parameters in one statement
+_MAX_PARAMS = 999
+
+
+def get_existing_paths(file_paths: List[str]) -> set:
+    """Get which of the given file paths are already in the library."""
+    file_paths = list(file_paths)
+    existing = set()
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        for start in range(0, len(file_paths), _MAX_PARAMS):
+            chunk = file_paths[start:start + _MAX_PARAMS]
+            cursor.execute(
+                f"SELECT file_path FROM books WHERE file_path IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            existing.update(row["file_path"] for row in cursor.fetchall())
+    return existing
+
+
+def get_all_books() -> List[DictRow]:
+    """Get all books from the database."""
+    return _cached_query(f"SELECT {_BOOK_COLS} FROM books ORDER BY date_added DESC")
 
 
 def get_book_by_id(book_id: int) -> Optional[Dict]:
@@ -139,124 +427,230 @@ def get_book_by_id(book_id: int) -> Optional[Dict]:
         return dict(row) if row else None
 
 
-def get_currently_reading() -> List[Dict]:
-    """Get books that are currently being read (progress > 0 and < 100)."""
+def get_cover(book_id: int) -> Optional[bytes]:
+    """Get the cover image BLOB for a single book."""
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM books 
-            WHERE progress > 0 AND progress < 100 
-            ORDER BY last_read DESC
-        """)
-        return [dict(row) for row in cursor.fetchall()]
+        cursor.execute("SELECT image FROM book_covers WHERE book_id = ?", (book_id,))
+        row = cursor.fetchone()
+        return row["image"] if row else None
+
+
+def get_currently_reading() -> List[DictRow]:
+    """Get books that are currently being read (progress > 0 and < 100)."""
+    return _cached_query(f"""
+        SELECT {_BOOK_COLS} FROM books 
+        WHERE progress > 0 AND progress < 100 
+        ORDER BY last_read DESC
+    """)
 
 
-def get_recent_books(limit: int = 10) -> List[Dict]:
+def get_recent_books(limit: int = 10) -> List[DictRow]:
     """Get recently added books."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM books ORDER BY date_added DESC LIMIT ?
-        """, (limit,))
-        return [dict(row) for row in cursor.fetchall()]
+    return _cached_query(f"""
+        SELECT {_BOOK_COLS} FROM books ORDER BY date_added DESC LIMIT ?
+    """, (limit,))
+
+
+def get_home_sections(recent_limit: int = 10) -> Dict[str, List[DictRow]]:
+    """Get the books in progress and the recently added books in one query."""
+    rows = _cached_query(f"""
+        SELECT * FROM (
+            SELECT {_BOOK_COLS}, 'reading' AS section, last_read AS sort_key
+            FROM books WHERE progress > 0 AND progress < 100
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT {_BOOK_COLS}, 'recent' AS section, date_added AS sort_key
+            FROM books ORDER BY date_added DESC LIMIT ?
+        )
+        ORDER BY section, sort_key DESC
+    """, (recent_limit,))
+    
+    sections = {"reading": [], "recent": []}
+    for book in rows:
+        sections[book["section"]].append(book)
+    return sections
+
+
+_UPDATE_PROGRESS_SQL = """
+    UPDATE books 
+    SET current_page = ?, total_pages = ?, progress = ?, last_read = ?
+    WHERE id = ?
+"""
+
+
+def _progress_params(book_id: int, current_page: int, total_pages: int,
+                     last_read: str) -> tuple:
+    """Build the _UPDATE_PROGRESS_SQL parameters for one book."""
+    progress = (current_page / total_pages * 100) if total_pages > 0 else 0
+    return (current_page, total_pages, progress, last_read, book_id)
 
 
 def update_reading_progress(book_id: int, current_page: int, total_pages: int):
     """Update reading progress for a book."""
-    progress = (current_page / total_pages * 100) if total_pages > 0 else 0
     with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE books 
-            SET current_page = ?, total_pages = ?, progress = ?, last_read = ?
-            WHERE id = ?
-        """, (current_page, total_pages, progress, datetime.now().isoformat(), book_id))
+        conn.execute(_UPDATE_PROGRESS_SQL, _progress_params(
+            book_id, current_page, total_pages, datetime.now().isoformat()))
         conn.commit()
+        _invalidate_cache()
 
 
-def toggle_favorite(book_id: int) -> bool:
-    """Toggle favorite status for a book."""
+def update_reading_progress_bulk(updates: List[tuple]):
+    """Update progress for many books in one transaction.
+    
+    Each update is (book_id, current_page, total_pages).
+    """
+    last_read = datetime.now().isoformat()
     with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT is_favorite FROM books WHERE id = ?", (book_id,))
-        row = cursor.fetchone()
-        new_status = 0 if row['is_favorite'] else 1
-        cursor.execute("UPDATE books SET is_favorite = ? WHERE id = ?", (new_status, book_id))
+        conn.executemany(_UPDATE_PROGRESS_SQL, (
+            _progress_params(book_id, current_page, total_pages, last_read)
+            for book_id, current_page, total_pages in updates))
         conn.commit()
-        return bool(new_status)
+        _invalidate_cache()
 
 
-def get_favorites() -> List[Dict]:
-    """Get all favorite books."""
+def _toggle_flag(column: str, book_id: int) -> bool:
+    """Flip a 0/1 flag column in a single UPDATE and return its new value."""
     with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM books WHERE is_favorite = 1 ORDER BY title")
-        return [dict(row) for row in cursor.fetchall()]
+        if _HAS_RETURNING:
+            row = conn.execute(f"""
+                UPDATE books SET {column} = NOT COALESCE({column}, 0)
+                WHERE id = ? RETURNING {column}
+            """, (book_id,)).fetchone()
+        else:
+            conn.execute(f"""
+                UPDATE books SET {column} = NOT COALESCE({column}, 0) WHERE id = ?
+            """, (book_id,))
+            row = conn.execute(f"SELECT {column} FROM books WHERE id = ?", (book_id,)).fetchone()
+        conn.commit()
+        _invalidate_cache()
+        return bool(row[0]) if row else False
+
+
+def toggle_favorite(book_id: int) -> bool:
+    """Toggle favorite status for a book."""
+    return _toggle_flag("is_favorite", book_id)
 
 
-def get_want_to_read() -> List[Dict]:
+def get_favorites() -> List[DictRow]:
+    """Get all favorite books."""
+    return _cached_query(f"SELECT {_BOOK_COLS} FROM books WHERE is_favorite = 1 ORDER BY title")
+
+
+def get_want_to_read() -> List[DictRow]:
     """Get books marked as 'want to read'."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM books WHERE want_to_read = 1 ORDER BY date_added DESC")
-        return [dict(row) for row in cursor.fetchall()]
+    return _cached_query(f"SELECT {_BOOK_COLS} FROM books WHERE want_to_read = 1 ORDER BY date_added DESC")
 
 
 def toggle_want_to_read(book_id: int) -> bool:
     """Toggle 'want to read' status for a book."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT want_to_read FROM books WHERE id = ?", (book_id,))
-        row = cursor.fetchone()
-        new_status = 0 if row['want_to_read'] else 1
-        cursor.execute("UPDATE books SET want_to_read = ? WHERE id = ?", (new_status, book_id))
-        conn.commit()
-        return bool(new_status)
+    return _toggle_flag("want_to_read", book_id)
 
 
-def get_finished() -> List[Dict]:
+def get_finished() -> List[DictRow]:
     """Get finished books."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM books WHERE finished = 1 ORDER BY last_read DESC")
-        return [dict(row) for row in cursor.fetchall()]
+    return _cached_query(f"SELECT {_BOOK_COLS} FROM books WHERE finished = 1 ORDER BY last_read DESC")
 
 
 def toggle_finished(book_id: int) -> bool:
     """Toggle finished status for a book."""
+    return _toggle_flag("finished", book_id)
+
+
+# Filter and sort order of each library view, keyed by collection id
+_COLLECTION_QUERIES = {
+    None: ("1", "date_added DESC"),
+    "favorites": ("is_favorite = 1", "title"),
+    "want_to_read": ("want_to_read = 1", "date_added DESC"),
+    "finished": ("finished = 1", "last_read DESC"),
+}
+
+
+def _library_filter(collection: Optional[str], file_type: Optional[str]) -> tuple:
+    """Build the WHERE clause, ORDER BY and parameters for a library view."""
+    where, order = _COLLECTION_QUERIES.get(collection, _COLLECTION_QUERIES[None])
+    params = ()
+    if file_type:
+        where += " AND lower(file_type) = ?"
+        params = (file_type.lower(),)
+    return where, order, params
+
+
+def get_book_ids(collection: Optional[str] = None, file_type: Optional[str] = None) -> List[int]:
+    """Get the ids of a library view's books (all books or a collection), in display order."""
+    where, order, params = _library_filter(collection, file_type)
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT finished FROM books WHERE id = ?", (book_id,))
-        row = cursor.fetchone()
-        new_status = 0 if row['finished'] else 1
-        cursor.execute("UPDATE books SET finished = ? WHERE id = ?", (new_status, book_id))
-        conn.commit()
-        return bool(new_status)
+        cursor.execute(f"SELECT id FROM books WHERE {where} ORDER BY {order}", params)
+        return [row["id"] for row in cursor.fetchall()]
+
+
+def get_books_by_ids(book_ids: List[int]) -> Dict[int, DictRow]:
+    """Get list rows for the given books, keyed by id (deleted books are missing)."""
+    books = {}
+    with get_connection() as conn:
+        for start in range(0, len(book_ids), _MAX_PARAMS):
+            chunk = book_ids[start:start + _MAX_PARAMS]
+            cursor = conn.execute(
+                f"SELECT {_BOOK_COLS} FROM books WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            cursor.row_factory = DictRow
+            books.update((row["id"], row) for row in cursor.fetchall())
+    return books
 
 
 def delete_book(book_id: int):
-    """Delete a book from the database."""
+    """Delete a book from the database, along with its cached thumbnails."""
     with get_connection() as conn:
         cursor = conn.cursor()
+        cursor.execute("SELECT file_path FROM books WHERE id = ?", (book_id,))
+        row = cursor.fetchone()
         cursor.execute("DELETE FROM books WHERE id = ?", (book_id,))
         conn.commit()
+        _invalidate_cache()
+    
+    if row is not None:
+        # Imported here: the components package pulls in the UI toolkit
+        from components import thumb_cache
+        thumb_cache.remove_thumbs(row["file_path"])
 
 
-def get_all_collections() -> List[Dict]:
+def get_all_collections() -> List[DictRow]:
     """Get all collections."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM collections ORDER BY id")
-        return [dict(row) for row in cursor.fetchall()]
+    return _cached_query("SELECT * FROM collections ORDER BY id")
+
+
+def _fts_query(query: str) -> str:
+    """Build an FTS5 prefix query from free-form search input."""
+    terms = query.split()
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
 
 
-def search_books(query: str) -> List[Dict]:
+def search_books(query: str) -> List[DictRow]:
     """Search books by title or author."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM books 
-            WHERE title LIKE ? OR author LIKE ?
-            ORDER BY title
-        """, (f"%{query}%", f"%{query}%"))
-        return [dict(row) for row in cursor.fetchall()]
+    if _fts_enabled:
+        match = _fts_query(query)
+        if not match:
+            return []
+        return _cached_query(f"""
+            SELECT {_BOOK_COLS} FROM books
+            JOIN (
+                SELECT rowid AS match_id, rank FROM books_fts
+                WHERE books_fts MATCH ?
+            ) f ON books.id = f.match_id
+            ORDER BY f.rank
+        """, (match,))
+    return _like_search(query)
+
+
+def _like_search(query: str) -> List[DictRow]:
+    """Search with LIKE for substring matches, listing prefix matches first."""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    contains, prefix = f"%{escaped}%", f"{escaped}%"
+    return _cached_query(f"""
+        SELECT {_BOOK_COLS} FROM books 
+        WHERE title LIKE ? ESCAPE '\\' OR author LIKE ? ESCAPE '\\'
+        ORDER BY (title LIKE ? ESCAPE '\\' OR author LIKE ? ESCAPE '\\') DESC, title
+    """, (contains, contains, prefix, prefix))
@@ -3,7 +3,10 @@ Apple Books Clone
 A native Python desktop application inspired by Apple Books.
 """
 
+import multiprocessing
 from app import main
 
 if __name__ == "__main__":
+    # Lets the frozen (PyInstaller) build start import worker processes
+    multiprocessing.freeze_support()
     main()
@@ -1,8 +1,22 @@
 """Pages package for Apple Books Clone."""
 
-from .home import HomePage
-from .library import LibraryPage
-from .store import StorePage
-from .reader import ReaderPage
+import importlib
+
+# Page modules are imported on first access, so importing one page doesn't
+# pull in the dependencies (ebooklib, PyMuPDF, lxml) of the others
+_PAGE_MODULES = {
+    "HomePage": ".home",
+    "LibraryPage": ".library",
+    "StorePage": ".store",
+    "ReaderPage": ".reader",
+}
 
 __all__ = ["HomePage", "LibraryPage", "StorePage", "ReaderPage"]
+
+
+def __getattr__(name):
+    """Import a page class the first time it is accessed."""
+    if name in _PAGE_MODULES:
+        module = importlib.import_module(_PAGE_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
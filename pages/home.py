@@ -7,6 +7,9 @@ import customtkinter as ctk
 from components.book_card import BookCard
 import database
 
+# How often the page checks whether a background query has finished
+LOAD_POLL_MS = 16
+
 
 class HomePage(ctk.CTkScrollableFrame):
     """Reading Now page showing current reading progress."""
@@ -14,6 +17,9 @@ class HomePage(ctk.CTkScrollableFrame):
     def __init__(self, parent, on_open_book):
         super().__init__(parent, fg_color="transparent")
         self.on_open_book = on_open_book
+        self._sections = {}  # title -> (section frame, grid frame, card pool)
+        self._sections_future = None  # Pending background query
+        self._sections_job = None
         self._create_widgets()
     
     def _create_widgets(self):
@@ -30,69 +36,113 @@ class HomePage(ctk.CTkScrollableFrame):
         )
         title.pack(anchor="w")
         
+        # Empty state (shown when no book is in progress)
+        self.empty_frame = ctk.CTkFrame(self, fg_color="transparent")
+        
+        empty_icon = ctk.CTkLabel(
+            self.empty_frame,
+            text="📖",
+            font=ctk.CTkFont(size=64)
+        )
+        empty_icon.pack(pady=(50, 20))
+        
+        empty_text = ctk.CTkLabel(
+            self.empty_frame,
+            text="No books in progress",
+            font=ctk.CTkFont(size=18),
+            text_color=("#86868B", "#86868B")
+        )
+        empty_text.pack()
+        
+        hint_text = ctk.CTkLabel(
+            self.empty_frame,
+            text="Import books from the Book Store to get started",
+            font=ctk.CTkFont(size=14),
+            text_color=("#86868B", "#86868B")
+        )
+        hint_text.pack(pady=(5, 0))
+        
+        self._load_sections()
+    
+    def _load_sections(self):
+        """Query the home sections in the background and show them when ready."""
+        # A newer load supersedes any query still in flight
+        if self._sections_job is not None:
+            self.after_cancel(self._sections_job)
+        if self._sections_future is not None:
+            self._sections_future.cancel()
+        
+        self._sections_future = database.query_async(database.get_home_sections, 8)
+        self._sections_job = self.after(LOAD_POLL_MS, self._poll_sections)
+    
+    def _poll_sections(self):
+        """Show the sections once the worker has finished (Tk thread only)."""
+        future = self._sections_future
+        if not future.done():
+            self._sections_job = self.after(LOAD_POLL_MS, self._poll_sections)
+            return
+        
+        self._sections_job = None
+        self._sections_future = None
+        self._show_sections(future.result())
+    
+    def _show_sections(self, sections: dict):
+        """Show the reading and recently added sections."""
+        # Unpack everything below the header so sections keep their order
+        self.empty_frame.pack_forget()
+        for section, _, _ in self._sections.values():
+            section.pack_forget()
+        
         # Currently reading section
-        reading_books = database.get_currently_reading()
+        reading_books = sections["reading"]
         
         if reading_books:
             self._create_section("Continue Reading", reading_books)
         else:
-            # Empty state
-            empty_frame = ctk.CTkFrame(self, fg_color="transparent")
-            empty_frame.pack(expand=True, fill="both", pady=50)
-            
-            empty_icon = ctk.CTkLabel(
-                empty_frame,
-                text="📖",
-                font=ctk.CTkFont(size=64)
-            )
-            empty_icon.pack(pady=(50, 20))
-            
-            empty_text = ctk.CTkLabel(
-                empty_frame,
-                text="No books in progress",
-                font=ctk.CTkFont(size=18),
-                text_color=("#86868B", "#86868B")
-            )
-            empty_text.pack()
-            
-            hint_text = ctk.CTkLabel(
-                empty_frame,
-                text="Import books from the Book Store to get started",
-                font=ctk.CTkFont(size=14),
-                text_color=("#86868B", "#86868B")
-            )
-            hint_text.pack(pady=(5, 0))
+            self.empty_frame.pack(expand=True, fill="both", pady=50)
         
         # Recent additions section
-        recent_books = database.get_recent_books(8)
+        recent_books = sections["recent"]
         if recent_books:
             self._create_section("Recently Added", recent_books)
     
     def _create_section(self, title: str, books: list):
-        """Create a section with books grid."""
-        section = ctk.CTkFrame(self, fg_color="transparent")
-        section.pack(fill="x", padx=30, pady=(20, 10))
-        
-        # Section title
-        section_title = ctk.CTkLabel(
-            section,
-            text=title,
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=("#1D1D1F", "#F5F5F7")
-        )
-        section_title.pack(anchor="w", pady=(0, 15))
+        """Show a section with books grid, reusing its cards."""
+        if title not in self._sections:
+            section = ctk.CTkFrame(self, fg_color="transparent")
+            
+            # Section title
+            section_title = ctk.CTkLabel(
+                section,
+                text=title,
+                font=ctk.CTkFont(size=20, weight="bold"),
+                text_color=("#1D1D1F", "#F5F5F7")
+            )
+            section_title.pack(anchor="w", pady=(0, 15))
+            
+            # Books grid
+            grid = ctk.CTkFrame(section, fg_color="transparent")
+            grid.pack(fill="x")
+            
+            self._sections[title] = (section, grid, [])
         
-        # Books grid
-        grid = ctk.CTkFrame(section, fg_color="transparent")
-        grid.pack(fill="x")
+        section, grid, card_pool = self._sections[title]
+        section.pack(fill="x", padx=30, pady=(20, 10))
         
+        # Reuse pooled cards, creating only the ones that are missing
         for i, book in enumerate(books):
-            card = BookCard(grid, book, on_click=self.on_open_book, size="medium")
+            if i < len(card_pool):
+                card = card_pool[i]
+                card.rebind(book)
+            else:
+                card = BookCard(grid, book, on_click=self.on_open_book, size="medium")
+                card_pool.append(card)
             card.grid(row=i // 5, column=i % 5, padx=10, pady=10, sticky="nw")
+        
+        # Hide cards not needed for this listing
+        for card in card_pool[len(books):]:
+            card.grid_forget()
     
     def refresh(self):
         """Refresh the page content."""
-        # Clear existing widgets
-        for widget in self.winfo_children():
-            widget.destroy()
-        self._create_widgets()
+        self._load_sections()
@@ -5,8 +5,100 @@ Shows all books organized in collections.
 
 import customtkinter as ctk
 from components.book_card import BookCard
+from components.virtual_grid import VirtualGrid
 import database
 
+# Footprint of a medium BookCard: cover, title, author and progress bar
+CARD_SIZE = (140, 284)
+
+# How often the page checks whether a background query has finished
+LOAD_POLL_MS = 16
+
+
+def _loading_book(book_id: int) -> dict:
+    """Stand-in row for a book whose page has not been fetched yet."""
+    return {"id": book_id, "title": "", "author": ""}
+
+
+class _BookPages:
+    """Read-only sequence of a library view's books, fetched a page at a time in the background.
+    
+    The ids are read up front, so the view keeps its length and order while
+    books are imported or deleted. Rows not fetched yet read as placeholders.
+    """
+    
+    PAGE_SIZE = 50
+    
+    def __init__(self, collection: str = None, file_type: str = None):
+        self._ids = database.get_book_ids(collection, file_type)
+        self._pages = {}  # page -> {book id: row}
+        self._pending = {}  # page -> future of its rows
+        self.on_request = None  # Called on the Tk thread when a page is queued
+        
+        # The first page is always shown, so fetch it up front
+        if self._ids:
+            self._pages[0] = database.get_books_by_ids(self._page_ids(0))
+    
+    def __len__(self):
+        return len(self._ids)
+    
+    def __getitem__(self, index: int) -> dict:
+        book_id = self._ids[index]
+        page = index // self.PAGE_SIZE
+        
+        # Queue this page and its neighbours, so scrolling on finds them ready
+        for neighbour in (page, page + 1, page - 1):
+            self._request(neighbour)
+        
+        rows = self._pages.get(page)
+        book = rows.get(book_id) if rows is not None else None
+        return book if book is not None else _loading_book(book_id)
+    
+    @property
+    def pending(self) -> bool:
+        """Whether any page is still being fetched."""
+        return bool(self._pending)
+    
+    def poll(self) -> bool:
+        """Collect fetched pages (Tk thread only); returns whether any arrived."""
+        arrived = False
+        for page, future in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[page]
+            try:
+                self._pages[page] = future.result()
+                arrived = True
+            except Exception:
+                pass  # Fetched again the next time it is shown
+        return arrived
+    
+    def _page_ids(self, page: int) -> list:
+        """Get the ids on one page."""
+        return self._ids[page * self.PAGE_SIZE:(page + 1) * self.PAGE_SIZE]
+    
+    def _request(self, page: int):
+        """Fetch a page on the database thread unless it is loaded or on its way."""
+        if page < 0 or page * self.PAGE_SIZE >= len(self._ids):
+            return
+        if page in self._pages or page in self._pending:
+            return
+        self._pending[page] = database.query_async(database.get_books_by_ids, self._page_ids(page))
+        if self.on_request is not None:
+            self.on_request()
+
+
+def _query_books(search_query: str, collection: str, file_type: str):
+    """Get the books for a library view. Runs on the database worker thread."""
+    if search_query:
+        books = database.search_books(search_query)
+        if file_type:
+            books = [b for b in books if b["file_type"].lower() == file_type]
+        return books
+    
+    # Collections are paged in as they scroll into view
+    return _BookPages(collection, file_type)
+
 
 class LibraryPage(ctk.CTkScrollableFrame):
     """Library page showing all books and collections."""
@@ -18,6 +110,9 @@ class LibraryPage(ctk.CTkScrollableFrame):
         self.current_collection = None  # None = all books
         self.search_query = ""
         self._search_job = None  # For debouncing
+        self._books_future = None  # Pending background book query
+        self._books_job = None
+        self._pages_job = None  # Pending check for background-fetched pages
         
         self._create_widgets()
     
@@ -80,6 +175,25 @@ class LibraryPage(ctk.CTkScrollableFrame):
         self.grid_container = ctk.CTkFrame(self, fg_color="transparent")
         self.grid_container.pack(fill="both", expand=True, padx=30)
         
+        # Book count
+        self.count_label = ctk.CTkLabel(
+            self.grid_container,
+            text="",
+            font=ctk.CTkFont(size=13),
+            text_color=("#86868B", "#86868B")
+        )
+        
+        # Books grid (only cards in view are created; kept across reloads)
+        self.books_grid = VirtualGrid(
+            self.grid_container,
+            [],
+            make_card=lambda parent, book: BookCard(
+                parent, book, on_click=self._open_book, size="medium"
+            ),
+            cols=5,
+            card_size=CARD_SIZE
+        )
+        
         self._load_books()
     
     def set_collection(self, collection_id: str):
@@ -103,30 +217,42 @@ class LibraryPage(ctk.CTkScrollableFrame):
         self._load_books()
     
     def _load_books(self):
-        """Load and display books."""
-        # Clear existing
+        """Query books in the background and display them when ready."""
+        # A newer load supersedes any query still in flight
+        if self._books_job is not None:
+            self.after_cancel(self._books_job)
+        if self._books_future is not None:
+            self._books_future.cancel()
+        
+        file_type = None if self.current_filter == "all" else self.current_filter
+        self._books_future = database.query_async(
+            _query_books, self.search_query, self.current_collection, file_type
+        )
+        self._books_job = self.after(LOAD_POLL_MS, self._poll_books)
+    
+    def _poll_books(self):
+        """Show the queried books once the worker has finished (Tk thread only)."""
+        future = self._books_future
+        if not future.done():
+            self._books_job = self.after(LOAD_POLL_MS, self._poll_books)
+            return
+        
+        self._books_job = None
+        self._books_future = None
+        self._show_books(future.result())
+    
+    def _show_books(self, books):
+        """Display a list of books, or the empty state."""
+        # Clear the previous empty state (the count and books grid are reused)
         for widget in self.grid_container.winfo_children():
-            widget.destroy()
-        
-        # Get books based on collection
-        if self.search_query:
-            books = database.search_books(self.search_query)
-        elif self.current_collection == "favorites":
-            books = database.get_favorites()
-        elif self.current_collection == "want_to_read":
-            books = database.get_want_to_read()
-        elif self.current_collection == "finished":
-            books = database.get_finished()
-        else:
-            books = database.get_all_books()
-        
-        # Apply file type filter
-        if self.current_filter == "epub":
-            books = [b for b in books if b["file_type"].lower() == "epub"]
-        elif self.current_filter == "pdf":
-            books = [b for b in books if b["file_type"].lower() == "pdf"]
+            if widget not in (self.count_label, self.books_grid):
+                widget.destroy()
         
         if not books:
+            self.count_label.pack_forget()
+            self.books_grid.pack_forget()
+            self.books_grid.set_items([])
+            
             # Empty state
             empty_frame = ctk.CTkFrame(self.grid_container, fg_color="transparent")
             empty_frame.pack(expand=True, pady=100)
@@ -174,22 +300,36 @@ class LibraryPage(ctk.CTkScrollableFrame):
                 hint.pack(pady=(5, 0))
             return
         
-        # Create grid
-        grid = ctk.CTkFrame(self.grid_container, fg_color="transparent")
-        grid.pack(fill="x")
-        
-        # Book count
-        count_label = ctk.CTkLabel(
-            grid,
-            text=f"{len(books)} books",
-            font=ctk.CTkFont(size=13),
-            text_color=("#86868B", "#86868B")
-        )
-        count_label.grid(row=0, column=0, columnspan=5, sticky="w", pady=(0, 15))
+        # Show grid
+        self.count_label.configure(text=f"{len(books)} books")
+        self.count_label.pack(anchor="w", pady=(0, 15))
+        self.books_grid.pack(anchor="w")
+        if isinstance(books, _BookPages):
+            books.on_request = self._schedule_pages_poll
+        self.books_grid.set_items(books)
+    
+    def _schedule_pages_poll(self):
+        """Check for fetched pages soon, unless a check is already scheduled."""
+        if self._pages_job is None:
+            self._pages_job = self.after(LOAD_POLL_MS, self._poll_pages)
+    
+    def _poll_pages(self):
+        """Show rows from pages fetched in the background (Tk thread only)."""
+        self._pages_job = None
+        books = self.books_grid.items
+        if not isinstance(books, _BookPages):
+            return
         
-        for i, book in enumerate(books):
-            card = BookCard(grid, book, on_click=self.on_open_book, size="medium")
-            card.grid(row=(i // 5) + 1, column=i % 5, padx=10, pady=10, sticky="nw")
+        # Rebinding swaps placeholders on screen for the fetched rows
+        if books.poll():
+            self.books_grid.set_items(books)
+        if books.pending:
+            self._schedule_pages_poll()
+    
+    def _open_book(self, book):
+        """Open a book, unless its row is still being fetched."""
+        if book.get("file_path"):
+            self.on_open_book(book)
     
     def _on_search(self, event):
         """Handle search input with debouncing."""
@@ -197,8 +337,8 @@ class LibraryPage(ctk.CTkScrollableFrame):
         if self._search_job:
             self.after_cancel(self._search_job)
         
-        # Schedule new search after 300ms
-        self._search_job = self.after(300, self._perform_search)
+        # Schedule new search after 150ms (FTS lookups are cheap enough)
+        self._search_job = self.after(150, self._perform_search)
     
     def _perform_search(self):
         """Actually perform the search."""
@@ -5,30 +5,294 @@ Full-featured book reader with two-page spread layout like real books.
 
 import customtkinter as ctk
 from ebooklib import epub
-from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
 import fitz  # PyMuPDF
-from PIL import Image
+from PIL import Image, ImageTk
 import io
+import os
+import re
+import posixpath
+import zipfile
 import tkinter as tk
 from tkinter import font
-from functools import lru_cache
+from functools import lru_cache, partial
+from collections import OrderedDict, Counter
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import warnings
 import webbrowser
+from components.fonts import font as shared_font
+from components import content_cache, page_cache
 import database
 
+# Tags pulled out of EPUB documents, in document order
+_CONTENT_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'img', 'image', 'svg', 'a')
+
+# lxml only parses str input that has no XML declaration
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+# Threads that parse an EPUB's documents side by side
+_PARSE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
+# Writes rendered PDF pages to the disk cache, so encoding them never holds
+# up prerendering; one thread keeps pruning after the writes queued before it
+_CACHE_WRITER = ThreadPoolExecutor(max_workers=1)
+
+
+# Sample of ordinary prose used to find a font's average character width
+_WIDTH_SAMPLE = "The quick brown fox jumps over the lazy dog, then naps. "
+
+# Longer ASCII paragraphs are estimated from the average character width
+# instead of being sent to Tk to measure
+_MEASURE_MAX_CHARS = 120
+
+# ASCII text estimated at under this fraction of the wrap width is taken
+# to fit on one line without measuring
+_ONE_LINE_FRACTION = 0.75
+
+# Largest box an EPUB image is shown in; images are shrunk to it once when decoded
+EPUB_IMAGE_MAX_SIZE = (1000, 350)
+
+# Font size increase per header level (h1 = largest, h6 = smallest), indexed by level
+_HEADER_SIZE_DELTAS = (0, 10, 6, 4, 2, 1, 0)
+
+# Text colors (light, dark): body text and h1/h2 headers, then h3 and below
+_TEXT_COLOR = ("#1D1D1F", "#F5F5F7")
+_SUBHEADER_COLOR = ("#48484A", "#C7C7CC")
+
+# Displayed EPUB images kept for reuse on later spreads and repaginations
+EPUB_PHOTO_CACHE_SIZE = 16
+
+# Paginations kept per book, so returning to a recent window size or
+# font size doesn't repaginate
+PAGINATION_CACHE_SIZE = 4
+
+# A slider drag only renders once it pauses this long (or is released)
+SLIDER_SETTLE_MS = 30
+
+# Repagination after font size clicks waits this long for further clicks
+FONT_SETTLE_MS = 200
+
+# Spreads laid out past the current one before it is shown; the rest of
+# the book is paginated in slices of PAGINATION_SLICE_MS between events
+PAGINATION_LOOKAHEAD = 2
+PAGINATION_SLICE_MS = 50
+
+# Reading progress is written at most this often while paging
+PROGRESS_FLUSH_MS = 1000
+
+# Memory budget for rendered PDF pages kept for reuse
+PDF_CACHE_BYTES = 64 * 1024 * 1024
+
+# PDF render sizes are snapped down to this step, so small window
+# resizes reuse cached pages
+PDF_SIZE_STEP = 25
+
+
+def _element_text(element) -> str:
+    """Text of an element with each fragment stripped, as BeautifulSoup's get_text(strip=True) gave."""
+    return ''.join(fragment.strip() for fragment in element.itertext())
+
+
+def _parse_document(item, image_names: dict, image_items: list) -> list:
+    """Content entries of one EPUB document, in order. Runs on a parse pool thread."""
+    entries = []
+    content = item.get_content().decode('utf-8', errors='ignore')
+    content = _XML_DECLARATION.sub('', content, count=1)
+    if not content.strip():
+        return entries
+    
+    # lxml builds the tree in C, without a Python object per node
+    try:
+        root = lxml.html.document_fromstring(content)
+    except (lxml.etree.ParserError, ValueError):
+        # Only a doctype, comment or whitespace: a chapter with no content
+        return entries
+    
+    # Process all elements in order
+    for element in root.iter(*_CONTENT_TAGS):
+        tag = element.tag
+        if tag in ['img', 'image']:
+            # Handle image - try multiple src attributes
+            img_src = element.get('src', '') or element.get('xlink:href', '') or element.get('href', '')
+            
+            if img_src:
+                # Extract just the filename for matching
+                img_filename = img_src.split('/')[-1].split('\\')[-1]
+                
+                # Look the image up by filename (references don't always match
+                # the manifest's case), falling back to a partial match
+                image_key = image_names.get(img_filename.lower())
+                if image_key is None:
+                    image_key = next((name for name in image_items if img_filename in name), None)
+                
+                if image_key:
+                    entries.append({
+                        'type': 'image',
+                        'image_key': image_key,
+                        'is_header': False
+                    })
+        elif tag == 'svg':
+            # Skip SVG for now
+            continue
+        elif tag == 'a':
+            # Check if this link is already handled by a parent block element
+            # If parent is a block tag we already capture, skip this independent 'a' processing
+            if element.getparent().tag in ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li']:
+                continue
+            
+            # Handle links - standalone links with text (not inside p/h/li)
+            href = element.get('href', '')
+            link_text = _element_text(element)
+            if link_text and href and href.startswith(('http://', 'https://')):
+                entries.append({
+                    'type': 'link',
+                    'text': link_text,
+                    'url': href,
+                    'is_header': False,
+                    'header_level': 0
+                })
+        else:
+            # Handle text (p, h1-h6, li)
+            text = _element_text(element)
+            
+            # Add bullet for list items
+            if tag == 'li':
+                text = "• " + text
+            
+            if text:
+                is_header = tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+                # Extract header level (1-6) for TOC hierarchy
+                header_level = int(tag[1]) if is_header else 0
+                
+                # Check for embedded links in this element
+                links = []
+                for link in element.iterdescendants('a'):
+                    link_href = link.get('href', '')
+                    link_text = _element_text(link)
+                    if link_href and link_text:
+                        links.append({'text': link_text, 'url': link_href})
+                
+                entries.append({
+                    'type': 'text',
+                    'text': text,
+                    'is_header': is_header,
+                    'header_level': header_level,
+                    'links': links or ()  # Most paragraphs share the empty tuple
+                })
+    
+    return entries
+
+
+def _table_width(text: str, font_key: tuple) -> int:
+    """Width of text summed from per-character widths (each distinct character is measured once per font)."""
+    widths = ReaderPage._char_widths.setdefault(font_key, {})
+    f = ReaderPage._font_cache[font_key]
+    
+    total = 0
+    for char, count in Counter(text).items():
+        char_width = widths.get(char)
+        if char_width is None:
+            char_width = widths[char] = f.measure(char)
+        total += char_width * count
+    return total
+
+
+@lru_cache(maxsize=8192)
+def _text_pixels(text: str, font_key: tuple) -> float:
+    """Unwrapped width of text (memoized per font, so a resize only redoes the wrap arithmetic)."""
+    # Short text is measured exactly; long plain paragraphs average out,
+    # so estimate them; long non-ASCII text (wide glyphs) is summed from
+    # a per-character width table
+    if len(text) <= _MEASURE_MAX_CHARS:
+        return ReaderPage._font_cache[font_key].measure(text)
+    if text.isascii():
+        return len(text) * ReaderPage._font_metrics[font_key][1]
+    return _table_width(text, font_key)
+
+
+@lru_cache(maxsize=8192)
+def _text_height(text: str, font_key: tuple, width: int) -> int:
+    """Estimate wrapped text height (memoized; repagination re-measures the same text)."""
+    # Line height in pixels
+    line_height, char_width = ReaderPage._font_metrics[font_key]
+    
+    # Simple wrapping estimation
+    if text.isascii() and len(text) * char_width < width * _ONE_LINE_FRACTION:
+        # Headers and short lines: well within one line, no need to measure
+        return (text.count('\n') + 1) * line_height
+    text_pixels = _text_pixels(text, font_key)
+    
+    # Add a 8% margin for word wrap overhead
+    num_lines = max(1, int((text_pixels * 1.08) / width) + 1)
+    
+    # Also account for explicit newlines
+    newline_lines = text.count('\n') + 1
+    num_lines = max(num_lines, newline_lines)
+    
+    return num_lines * line_height
+
+
+class _EpubImages:
+    """Image files of an open EPUB, read from the archive only when displayed."""
+    
+    def __init__(self, file_path: str, names: list):
+        self._archive = zipfile.ZipFile(file_path)
+        self._lock = threading.Lock()  # Read from the Tk thread and the prefetch worker
+        
+        # Item names are relative to the package document, so match them
+        # against every trailing part of the archive paths
+        suffixes = {}
+        for entry in self._archive.namelist():
+            parts = entry.split('/')
+            for i in range(len(parts)):
+                suffixes.setdefault('/'.join(parts[i:]), entry)
+        
+        self._entries = {}
+        for name in names:
+            path = posixpath.normpath(name)
+            while path.startswith('../'):
+                path = path[3:]
+            if path in suffixes:
+                self._entries[name] = suffixes[path]
+    
+    def read(self, name: str) -> bytes:
+        """Read one image's bytes from the archive."""
+        with self._lock:
+            return self._archive.read(self._entries[name])
+    
+    def close(self):
+        """Close the archive."""
+        with self._lock:
+            self._archive.close()
+
+
+@lru_cache(maxsize=32)
+def _decode_image(images: _EpubImages, name: str) -> Image.Image:
+    """Decode an EPUB image on first display (only recently shown images stay decoded)."""
+    img = Image.open(io.BytesIO(images.read(name)))
+    img.draft('RGB', EPUB_IMAGE_MAX_SIZE)  # JPEGs decode straight at a reduced scale
+    img = img.convert('RGB')
+    img.thumbnail(EPUB_IMAGE_MAX_SIZE, Image.Resampling.LANCZOS)
+    return img
+
 
 class ReaderPage(ctk.CTkFrame):
     """Book reader with authentic two-page spread layout."""
     
     # Cache for font metrics
     _font_cache = {}
+    _font_metrics = {}  # (linespace, average character width) per font key
+    _char_widths = {}  # font key -> {character: width}, for long non-ASCII text
     
     def __init__(self, parent, on_back):
         super().__init__(parent, fg_color=("#FAFAFA", "#1C1C1E"))
         self.on_back = on_back
         self.book_data = None
         self.current_page = 0
-        self.total_pages = 0
-        self.pages = []  # Paginated content
+        self._set_pages([])  # Paginated content
         self.pdf_doc = None
         self.font_size = 18
         self.line_height = 1.6
@@ -42,14 +306,54 @@ class ReaderPage(ctk.CTkFrame):
         self.toc_entries = []  # List of {title, page_index}
         self.toc_visible = False
         
-        # Image cache for EPUB images
-        self._image_cache = {}
+        # The open EPUB's images, read and decoded on display
+        self._image_data = None
+        self._epub_photo_cache = OrderedDict()  # (image name, size) -> CTkImage
+        
+        # PDF page cache for rendered pages: cache key -> (photo, size in bytes),
+        # least recently shown evicted first once over PDF_CACHE_BYTES
+        self._pdf_page_cache = OrderedDict()
+        self._pdf_cache_bytes = 0
+        
+        # Background rendering of neighbouring spreads; MuPDF documents are
+        # not thread-safe, so every use of one holds the lock
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        self._pdf_lock = threading.Lock()
+        self._pdf_prerendered = {}  # cache key -> Future of a PIL image
+        
+        # Pending repagination after a resize or font size change
+        self._resize_job = None
+        self._font_job = None
         
-        # PDF page cache for rendered pages
-        self._pdf_page_cache = {}
+        # Spread picked on the slider, rendered once the drag settles
+        self._pending_spread = None
+        self._slider_job = None
+        
+        # Navigation values last shown, so unchanged ones aren't reconfigured
+        self._last_page_label_text = None
+        self._last_progress = -1.0
+        self._last_button_states = None
+        self._last_nav_key = None
+        
+        # Latest unsaved progress per book: book id -> (book id, current page, total pages)
+        self._pending_progress = {}
+        self._progress_job = None
+        
+        # Pages per (page width, page height, font size, font family) for the open EPUB
+        self._pagination_cache = OrderedDict()
+        
+        # Pagination still running in idle time: (cache key, page generator, pages so far)
+        self._pagination = None
+        self._pagination_job = None
+        
+        # Hidden content widgets kept for reuse on the next page turn,
+        # per page container: kind ("text", "link", "image") -> widgets
+        self._widget_pools = {}
         
         self._create_widgets()
         self.bind("<Configure>", self._on_resize)
+        # On the frame itself: CTkFrame.bind would bind its inner canvas instead
+        tk.Misc.bind(self, "<Destroy>", self._on_destroy, "+")
     
     def _create_widgets(self):
         """Create reader widgets."""
@@ -326,6 +630,7 @@ class ReaderPage(ctk.CTkFrame):
         )
         self.progress_slider.pack()
         self.progress_slider.set(0)
+        self.progress_slider.bind("<ButtonRelease-1>", self._apply_pending_spread, add="+")
         
         # Page indicator
         self.page_label = ctk.CTkLabel(
@@ -388,18 +693,19 @@ class ReaderPage(ctk.CTkFrame):
         """Handle window resize."""
         if self.book_data and self.file_type == "epub":
             self._calculate_page_dimensions()
-            # Debounce repagination for performance
-            if hasattr(self, '_resize_job'):
-                self.after_cancel(self._resize_job)
-            self._resize_job = self.after(200, self._perform_resize_update)
+            # Coalesce a burst of resize events into one repagination
+            if self._resize_job is None:
+                self._resize_job = self.after_idle(self._perform_resize_update)
 
     def _perform_resize_update(self):
+        self._resize_job = None
         self._repaginate_epub()
         self._show_current_spread()
     
     def load_book(self, book_data: dict):
         """Load a book for reading."""
-        self.book_data = book_data
+        # Copy: list rows are read-only and the reader updates its book in place
+        self.book_data = dict(book_data)
         self.current_page = book_data.get("current_page", 0)
         self.title_label.configure(text=book_data.get("title", "Unknown"))
         
@@ -429,119 +735,27 @@ class ReaderPage(ctk.CTkFrame):
         self.right_pdf_image.pack_forget()
         
         try:
-            book = epub.read_epub(file_path)
             self.structured_content = []
-            seen_texts = set()
-            
-            # Extract all images using MIME type and extension
-            image_map = {}
-            image_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg')
+            self._pagination_cache.clear()
+            self._epub_photo_cache.clear()
+            if self._image_data is not None:
+                self._image_data.close()
+                self._image_data = None
             
-            for item in book.get_items():
-                item_name = item.get_name() or ''
-                media_type = item.media_type or ''
-                
-                # Check if it's an image by MIME type or extension
-                is_image = (
-                    media_type.startswith('image/') or
-                    item_name.lower().endswith(image_extensions)
-                )
-                
-                if is_image:
-                    try:
-                        img_data = item.get_content()
-                        img = Image.open(io.BytesIO(img_data))
-                        img = img.convert('RGB')  # Ensure compatible format
-                        image_map[item_name] = img
-                    except Exception:
-                        pass  # Skip failed images
-            
-            # Extract content with image references
-            for item in book.get_items():
-                if item.get_type() == 9:  # Document type
-                    content = item.get_content().decode('utf-8', errors='ignore')
-                    soup = BeautifulSoup(content, 'html.parser')
-                    
-                    # Process all elements in order
-                    for element in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'img', 'image', 'svg', 'a']):
-                        if element.name in ['img', 'image']:
-                            # Handle image - try multiple src attributes
-                            img_src = element.get('src', '') or element.get('xlink:href', '') or element.get('href', '')
-                            
-                            if img_src:
-                                # Extract just the filename for matching
-                                img_filename = img_src.split('/')[-1].split('\\')[-1]
-                                
-                                # Try to find the image in our map
-                                img_obj = None
-                                for img_name, img in image_map.items():
-                                    stored_filename = img_name.split('/')[-1].split('\\')[-1]
-                                    if img_filename == stored_filename or img_filename in img_name:
-                                        img_obj = img.copy()  # Copy to avoid issues
-                                        break
-                                
-                                if img_obj:
-                                    self.structured_content.append({
-                                        'type': 'image',
-                                        'image': img_obj,
-                                        'is_header': False
-                                    })
-                                    # Cache the image
-                                    self._image_cache[img_filename] = img_obj
-                        elif element.name == 'svg':
-                            # Skip SVG for now
-                            continue
-                        elif element.name == 'a':
-                            # Check if this link is already handled by a parent block element
-                            # If parent is a block tag we already capture, skip this independent 'a' processing
-                            if element.parent.name in ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li']:
-                                continue
-                            
-                            # Handle links - standalone links with text (not inside p/h/li)
-                            href = element.get('href', '')
-                            link_text = element.get_text(strip=True)
-                            if link_text and href and href.startswith(('http://', 'https://')):
-                                if link_text not in seen_texts:
-                                    seen_texts.add(link_text)
-                                    self.structured_content.append({
-                                        'type': 'link',
-                                        'text': link_text,
-                                        'url': href,
-                                        'is_header': False,
-                                        'header_level': 0
-                                    })
-                        else:
-                            # Handle text (p, h1-h6, li)
-                            text = element.get_text(strip=True)
-                            
-                            # Add bullet for list items
-                            if element.name == 'li':
-                                text = "• " + text
-                                
-                            if text and text not in seen_texts:
-                                seen_texts.add(text)
-                                is_header = element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
-                                # Extract header level (1-6) for TOC hierarchy
-                                header_level = int(element.name[1]) if is_header else 0
-                                
-                                # Check for embedded links in this element
-                                links = []
-                                for link in element.find_all('a'):
-                                    link_href = link.get('href', '')
-                                    link_text = link.get_text(strip=True)
-                                    if link_href and link_text:
-                                        links.append({'text': link_text, 'url': link_href})
-                                
-                                self.structured_content.append({
-                                    'type': 'text',
-                                    'text': text,
-                                    'is_header': is_header,
-                                    'header_level': header_level,
-                                    'links': links
-                                })
-            
-            # Extract TOC from EPUB
-            self._extract_toc_from_epub(book)
+            # Reopened books come straight from the parsed-content cache
+            cached = content_cache.get_content(file_path)
+            if cached is not None:
+                self.structured_content = cached["structured_content"]
+                self.toc_entries = cached["toc_entries"]
+                image_items = cached["image_items"]
+            else:
+                image_items = self._parse_epub(file_path)
+                content_cache.put_content(file_path, {
+                    "structured_content": self.structured_content,
+                    "toc_entries": self.toc_entries,
+                    "image_items": image_items,
+                })
+            self._image_data = _EpubImages(file_path, image_items)
             
             # Ensure window is updated before calculating pagination
             self.update_idletasks()
@@ -552,53 +766,152 @@ class ReaderPage(ctk.CTkFrame):
             self._populate_toc()
             
         except Exception as e:
-            self.pages = [[{'type': 'text', 'text': f"Error loading EPUB:\n{str(e)}"}]]
-            self.total_pages = 1
+            self._set_pages([[{'type': 'text', 'text': f"Error loading EPUB:\n{str(e)}"}]])
+    
+    def _parse_epub(self, file_path: str) -> list:
+        """Read an EPUB's content and TOC; returns the names of its images."""
+        book = epub.read_epub(file_path)
+        seen_texts = set()
+        
+        # Note images using MIME type and extension; their bytes are only
+        # read and decoded when their page is shown
+        image_items = []
+        image_names = {}  # lowercase filename -> item name
+        image_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg')
+        
+        # Sort items in one pass; documents are parsed once every image is known
+        documents = []
+        for item in book.get_items():
+            if item.get_type() == 9:  # Document type
+                documents.append(item)
+                continue
+            
+            item_name = item.get_name() or ''
+            media_type = item.media_type or ''
+            
+            # Check if it's an image by MIME type or extension
+            is_image = (
+                media_type.startswith('image/') or
+                item_name.lower().endswith(image_extensions)
+            )
+            
+            if is_image:
+                image_items.append(item_name)
+                image_names.setdefault(item_name.split('/')[-1].split('\\')[-1].lower(), item_name)
+        
+        # Reading order comes from the spine; documents it leaves out follow
+        # in manifest order
+        spine_order = {idref: i for i, (idref, _) in enumerate(book.spine)}
+        documents.sort(key=lambda item: spine_order.get(item.get_id(), len(spine_order)))
+        
+        # Documents are parsed in parallel (lxml releases the GIL while it
+        # parses); repeated text is dropped afterwards, in reading order
+        parse = partial(_parse_document, image_names=image_names, image_items=image_items)
+        for entries in _PARSE_POOL.map(parse, documents):
+            for entry in entries:
+                if entry['type'] != 'image':
+                    if entry['text'] in seen_texts:
+                        continue
+                    seen_texts.add(entry['text'])
+                self.structured_content.append(entry)
+        
+        # Extract TOC from EPUB
+        self._extract_toc_from_epub(book)
+        return image_items
     
     def _get_font(self, font_family, font_size, is_header=False):
         """Get or create a cached font object."""
         cache_key = (font_family, font_size, is_header)
         if cache_key not in self._font_cache:
-            self._font_cache[cache_key] = font.Font(
+            f = font.Font(
+                root=self,
                 family=font_family, 
                 size=font_size + (4 if is_header else 0),
                 weight="bold" if is_header else "normal"
             )
+            self._font_cache[cache_key] = f
+            
+            # Read metrics once, so pagination never asks Tk for them again
+            self._font_metrics[cache_key] = (
+                f.metrics('linespace'),
+                f.measure(_WIDTH_SAMPLE) / len(_WIDTH_SAMPLE)
+            )
         return self._font_cache[cache_key]
     
     def _measure_text_height(self, text, font_family, font_size, width, is_header=False):
         """
         Estimate height of text wrapped to a specific width using cached font metrics.
         """
-        f = self._get_font(font_family, font_size, is_header)
-        
-        # Line height in pixels
-        line_height = f.metrics('linespace')
-        
-        # Simple wrapping estimation
-        # Total pixels wide
-        text_pixels = f.measure(text)
-        
-        # Add a 8% margin for word wrap overhead
-        num_lines = max(1, int((text_pixels * 1.08) / width) + 1)
-        
-        # Also account for explicit newlines
-        newline_lines = text.count('\n') + 1
-        num_lines = max(num_lines, newline_lines)
-        
-        return num_lines * line_height
+        self._get_font(font_family, font_size, is_header)
+        return _text_height(text, (font_family, font_size, is_header), width)
 
     def _repaginate_epub(self):
         """
         Pixel-height based pagination.
-        Fills pages consistently and prevents cut-offs.
+        Lays out the pages around the current spread now and the rest in idle time.
         """
+        self._cancel_pagination()
         if not self.structured_content:
             return
             
-        self.pages = []
         page_width, page_height = self._calculate_page_dimensions()
         
+        # Reuse the pagination from the last time this layout was shown
+        cache_key = (page_width, page_height, self.font_size, self.font_family)
+        if cache_key in self._pagination_cache:
+            self._pagination_cache.move_to_end(cache_key)
+            self._set_pages(self._pagination_cache[cache_key])
+            self._update_navigation()
+            self._update_toc_page_indices()
+            return
+        
+        stream = self._paginate_stream(page_width, page_height, self.font_size, self.font_family)
+        self._pagination = (cache_key, stream, [])
+        self._continue_pagination(until_page=(self.current_page + PAGINATION_LOOKAHEAD + 1) * 2)
+    
+    def _continue_pagination(self, until_page=None):
+        """Lay out more pages: up to until_page, or for one time slice when run from idle."""
+        self._pagination_job = None
+        cache_key, stream, pages = self._pagination
+        deadline = time.monotonic() + PAGINATION_SLICE_MS / 1000
+        
+        for page in stream:
+            pages.append(page)
+            if until_page is not None:
+                if len(pages) >= until_page:
+                    break
+            elif time.monotonic() >= deadline:
+                break
+        else:
+            # Whole book laid out
+            self._pagination = None
+            self._pagination_cache[cache_key] = pages
+            if len(self._pagination_cache) > PAGINATION_CACHE_SIZE:
+                self._pagination_cache.popitem(last=False)
+            
+            self._set_pages(pages)
+            self._update_navigation()
+            
+            # Chapters past the first pages can only be placed now (TOC buttons
+            # read their entry's page on click), and progress is only saved
+            # against the final page count
+            self._update_toc_page_indices()
+            self._save_progress()
+            return
+        
+        self._set_pages(pages)
+        self._update_navigation()
+        self._pagination_job = self.after_idle(self._continue_pagination)
+    
+    def _cancel_pagination(self):
+        """Drop any pagination still running in idle time."""
+        if self._pagination_job is not None:
+            self.after_cancel(self._pagination_job)
+            self._pagination_job = None
+        self._pagination = None
+    
+    def _paginate_stream(self, page_width, page_height, font_size, font_family):
+        """Generate pages in order, filling each consistently and preventing cut-offs."""
         # Available vertical space - minimize margins to fill pages
         available_height = page_height - 50  # Just enough for page number
         wrap_width = page_width - 80  # Less horizontal padding too
@@ -614,10 +927,10 @@ class ReaderPage(ctk.CTkFrame):
             
             if item['type'] == 'image':
                 # Fixed estimation for images, will be resized to max 350
-                img_h = 350 + 20 # img_h + pady
+                img_h = EPUB_IMAGE_MAX_SIZE[1] + 20 # img_h + pady
                 
                 if current_height + img_h > available_height and current_page_items:
-                    self.pages.append(current_page_items)
+                    yield current_page_items
                     current_page_items = [item]
                     current_height = img_h
                 else:
@@ -628,7 +941,7 @@ class ReaderPage(ctk.CTkFrame):
                 # Standalone link
                 link_h = 40
                 if current_height + link_h > available_height and current_page_items:
-                    self.pages.append(current_page_items)
+                    yield current_page_items
                     current_page_items = [item]
                     current_height = link_h
                 else:
@@ -641,7 +954,7 @@ class ReaderPage(ctk.CTkFrame):
                 header_level = item.get('header_level', 0)
                 links = item.get('links', [])
                 
-                h = self._measure_text_height(text, self.font_family, self.font_size, wrap_width, is_header)
+                h = self._measure_text_height(text, font_family, font_size, wrap_width, is_header)
                 
                 if current_height + h + p_spacing <= available_height:
                     # Fits completely
@@ -649,11 +962,17 @@ class ReaderPage(ctk.CTkFrame):
                     current_height += h + p_spacing
                 else:
                     # Paragraph too long, split it by lines
-                    remaining_text = text
-                    f = self._get_font(self.font_family, self.font_size, is_header)
-                    line_height = f.metrics('linespace')
+                    self._get_font(font_family, font_size, is_header)
+                    line_height, char_width = self._font_metrics[(font_family, font_size, is_header)]
+                    
+                    # Estimate characters per line from the font's average width
+                    # (with the same wrap margin as _text_height), so splitting
+                    # needs no further measuring
+                    chars_per_line = max(1, int(wrap_width / (char_width * 1.08)))
                     
-                    while remaining_text:
+                    # Walk the paragraph by offset rather than re-slicing the remainder
+                    start = 0
+                    while start < len(text):
                         space_left = available_height - current_height
                         
                         # How many lines fit?
@@ -661,36 +980,34 @@ class ReaderPage(ctk.CTkFrame):
                         
                         if lines_that_fit < 2 and current_page_items:
                             # Start new page if only 1-2 lines fit
-                            self.pages.append(current_page_items)
+                            yield current_page_items
                             current_page_items = []
                             current_height = 0
                             continue
                             
-                        # Estimate characters per line - slightly more conservative
-                        chars_per_line = int(wrap_width / (self.font_size * 0.42))
-                        total_chars_that_fit = lines_that_fit * chars_per_line
+                        total_chars_that_fit = max(1, lines_that_fit * chars_per_line)
+                        end = start + total_chars_that_fit
                         
-                        if len(remaining_text) <= total_chars_that_fit:
+                        if len(text) <= end:
                             # Fits now
-                            chunk_h = self._measure_text_height(remaining_text, self.font_family, self.font_size, wrap_width, is_header)
+                            chunk_h = -(-(len(text) - start) // chars_per_line) * line_height
                             current_page_items.append({
                                 'type': 'text',
-                                'text': remaining_text,
+                                'text': text[start:],
                                 'is_header': is_header,
                                 'header_level': header_level,
                                 'links': links # Pass links to all chunks (renderer will filter)
                             })
                             current_height += chunk_h + p_spacing
-                            remaining_text = ""
+                            start = len(text)
                         else:
                             # Split by words
-                            chunk = remaining_text[:total_chars_that_fit]
-                            last_space = chunk.rfind(' ')
-                            split_idx = last_space if last_space > total_chars_that_fit * 0.8 else total_chars_that_fit
+                            last_space = text.rfind(' ', start, end)
+                            split_idx = last_space if last_space > start + total_chars_that_fit * 0.8 else end
                             
-                            page_chunk = remaining_text[:split_idx].strip()
+                            page_chunk = text[start:split_idx].strip()
                             if page_chunk:
-                                chunk_h = self._measure_text_height(page_chunk, self.font_family, self.font_size, wrap_width, is_header)
+                                # Fills the rest of the page, so its height is not needed
                                 current_page_items.append({
                                     'type': 'text',
                                     'text': page_chunk,
@@ -698,20 +1015,20 @@ class ReaderPage(ctk.CTkFrame):
                                     'header_level': header_level,
                                     'links': links # Pass links to all chunks
                                 })
-                                current_height += chunk_h + p_spacing
                             
                             # Start new page
-                            self.pages.append(current_page_items)
+                            yield current_page_items
                             current_page_items = []
                             current_height = 0
-                            remaining_text = remaining_text[split_idx:].strip()
+                            
+                            # Skip the whitespace the next page would start with
+                            start = split_idx
+                            while start < len(text) and text[start].isspace():
+                                start += 1
         
         # Final page
         if current_page_items:
-            self.pages.append(current_page_items)
-            
-        self.total_pages = len(self.pages) or 1
-        self._update_navigation()
+            yield current_page_items
 
     def _load_pdf(self, file_path: str):
         """Load PDF content."""
@@ -721,20 +1038,15 @@ class ReaderPage(ctk.CTkFrame):
         self.left_pdf_image.pack(fill="both", expand=True)
         self.right_pdf_image.pack(fill="both", expand=True)
         
-        # Clear cache when loading a new PDF
-        self._pdf_page_cache.clear()
-        
         try:
-            if self.pdf_doc:
-                self.pdf_doc.close()
+            # Also clears the page cache of the previous PDF
+            self._close_pdf()
             
             self.pdf_doc = fitz.open(file_path)
-            self.total_pages = self.pdf_doc.page_count
-            self.pages = list(range(self.total_pages))
+            self._set_pages(range(self.pdf_doc.page_count))
             
         except Exception:
-            self.total_pages = 0
-            self.pages = []
+            self._set_pages([])
         
         self._update_navigation()
     
@@ -768,15 +1080,29 @@ class ReaderPage(ctk.CTkFrame):
             self.right_content_widgets, 
             self.right_page_num
         )
+        
+        # Decode the next and previous spreads' images while this one is being read
+        self._prefetch_epub_images((left_idx + 2, left_idx + 3, left_idx - 2, left_idx - 1))
+    
+    def _prefetch_epub_images(self, page_indices):
+        """Decode images on the given pages in the background (text widgets must be built on the Tk thread)."""
+        for page_idx in page_indices:
+            if not 0 <= page_idx < self.total_pages:
+                continue
+            for item in self.pages[page_idx]:
+                if item['type'] == 'image':
+                    self._prefetch_executor.submit(_decode_image, self._image_data, item['image_key'])
     
     def _display_page_content(self, page_idx, container, widget_list, page_num_label):
         """Display page content with native text and image widgets."""
-        # Clear previous content
-        for widget in widget_list:
-            widget.destroy()
+        # Hide previous content and keep its widgets for reuse
+        pool = self._widget_pools.setdefault(container, {"text": [], "link": [], "image": []})
+        for kind, widget in widget_list:
+            widget.pack_forget()
+            pool[kind].append(widget)
         widget_list.clear()
         
-        if page_idx >= len(self.pages):
+        if page_idx >= self.total_pages:
             page_num_label.configure(text="")
             return
         
@@ -797,20 +1123,18 @@ class ReaderPage(ctk.CTkFrame):
                 
                 # Calculate font size and style based on header level
                 if is_header:
-                    # h1 = largest, h6 = smallest
-                    size_map = {1: 10, 2: 6, 3: 4, 4: 2, 5: 1, 6: 0}
-                    font_size_delta = size_map.get(header_level, 0)
+                    font_size_delta = _HEADER_SIZE_DELTAS[header_level] if header_level <= 6 else 0
                     font_weight = "bold"
                     # h1/h2 = dark, h3+ = slightly lighter
                     if header_level <= 2:
-                        text_color = ("#1D1D1F", "#F5F5F7")
+                        text_color = _TEXT_COLOR
                     else:
-                        text_color = ("#48484A", "#C7C7CC")
+                        text_color = _SUBHEADER_COLOR
                     spacing = 16 if header_level <= 2 else 12
                 else:
                     font_size_delta = 0
                     font_weight = "normal"
-                    text_color = ("#1D1D1F", "#F5F5F7")
+                    text_color = _TEXT_COLOR
                     spacing = 10
                 
                 # Estimate height for textbox
@@ -818,23 +1142,37 @@ class ReaderPage(ctk.CTkFrame):
                 # Add buffer for textbox padding/rendering differences
                 h += 10
                 
-                # Create Textbox for rich text support
-                textbox = ctk.CTkTextbox(
-                    container,
-                    height=h,
-                    font=ctk.CTkFont(
-                        family=self.font_family, 
-                        size=self.font_size + font_size_delta,
-                        weight=font_weight
-                    ),
-                    text_color=text_color,
-                    fg_color="transparent",
-                    wrap="word",
-                    activate_scrollbars=False,
-                    padx=0,
-                    pady=0,
-                    border_width=0
-                )
+                text_font = shared_font(self.font_size + font_size_delta, font_weight, self.font_family)
+                
+                if pool["text"]:
+                    # Reuse a Textbox from an earlier page
+                    textbox = pool["text"].pop()
+                    textbox.configure(state="normal", height=h, font=text_font, text_color=text_color, cursor="arrow")
+                    textbox.delete("1.0", "end")
+                    for tag_name in textbox._link_urls:
+                        textbox.tag_delete(tag_name)
+                    textbox._link_urls.clear()
+                else:
+                    # Create Textbox for rich text support
+                    textbox = ctk.CTkTextbox(
+                        container,
+                        height=h,
+                        font=text_font,
+                        text_color=text_color,
+                        fg_color="transparent",
+                        wrap="word",
+                        activate_scrollbars=False,
+                        padx=0,
+                        pady=0,
+                        border_width=0
+                    )
+                    # Links share one bound "link" tag, bound once per textbox (each
+                    # tag_bind creates a Tcl command, and pooled textboxes live on);
+                    # the link_<i> tags only map a click back to its URL
+                    textbox._link_urls = {}
+                    textbox.tag_bind("link", "<Button-1>", partial(self._on_link_click, textbox))
+                    textbox.tag_bind("link", "<Enter>", lambda e, t=textbox: t.configure(cursor="hand2"))
+                    textbox.tag_bind("link", "<Leave>", lambda e, t=textbox: t.configure(cursor="arrow"))
                 textbox.pack(fill="x", anchor="w", pady=(0, spacing))
                 
                 # Insert text
@@ -842,6 +1180,7 @@ class ReaderPage(ctk.CTkFrame):
                 
                 # Apply link tags if any
                 if links:
+                    textbox.tag_config("link", foreground="#007AFF" if ctk.get_appearance_mode()=="Light" else "#0A84FF", underline=True)
                     start_index = "1.0"
                     for i, link in enumerate(links):
                         link_text = link['text']
@@ -860,14 +1199,9 @@ class ReaderPage(ctk.CTkFrame):
                             end_pos = f"{pos}+{length}c"
                             
                             tag_name = f"link_{i}"
+                            textbox.tag_add("link", pos, end_pos)
                             textbox.tag_add(tag_name, pos, end_pos)
-                            textbox.tag_config(tag_name, foreground="#007AFF" if ctk.get_appearance_mode()=="Light" else "#0A84FF", underline=True)
-                            
-                            # Bind events
-                            # Use closure default arg to capture current url
-                            textbox.tag_bind(tag_name, "<Button-1>", lambda e, url=link_url: self._open_link(url))
-                            textbox.tag_bind(tag_name, "<Enter>", lambda e: textbox.configure(cursor="hand2"))
-                            textbox.tag_bind(tag_name, "<Leave>", lambda e: textbox.configure(cursor="arrow"))
+                            textbox._link_urls[tag_name] = link_url
                             
                             # Update start index to avoid re-tagging same text if it appears again for a different link
                             # +1 char to move past
@@ -875,52 +1209,80 @@ class ReaderPage(ctk.CTkFrame):
                 
                 # Make read-only after inserting content
                 textbox.configure(state="disabled")
-                widget_list.append(textbox)
+                widget_list.append(("text", textbox))
                 
             elif item.get('type') == 'link':
                 # Standalone clickable link
                 link_text = item.get('text', 'Link')
                 link_url = item.get('url', '')
                 
-                link_btn = ctk.CTkButton(
-                    container,
-                    text=f"🔗 {link_text}",
-                    anchor="w",
-                    height=32,
-                    font=ctk.CTkFont(family=self.font_family, size=self.font_size - 1),
-                    fg_color="transparent",
-                    text_color=("#007AFF", "#0A84FF"),
-                    hover_color=("#E5F1FF", "#1C3A5F"),
-                    corner_radius=6,
-                    command=lambda url=link_url: self._open_link(url)
-                )
+                link_font = shared_font(self.font_size - 1, "normal", self.font_family)
+                if pool["link"]:
+                    link_btn = pool["link"].pop()
+                    link_btn.configure(
+                        text=f"🔗 {link_text}",
+                        font=link_font,
+                        command=partial(self._open_link, link_url)
+                    )
+                else:
+                    link_btn = ctk.CTkButton(
+                        container,
+                        text=f"🔗 {link_text}",
+                        anchor="w",
+                        height=32,
+                        font=link_font,
+                        fg_color="transparent",
+                        text_color=("#007AFF", "#0A84FF"),
+                        hover_color=("#E5F1FF", "#1C3A5F"),
+                        corner_radius=6,
+                        command=partial(self._open_link, link_url)
+                    )
                 link_btn.pack(fill="x", anchor="w", pady=(0, 8))
-                widget_list.append(link_btn)
+                widget_list.append(("link", link_btn))
                 
             elif item['type'] == 'image':
                 try:
-                    img = item['image']
+                    img = _decode_image(self._image_data, item['image_key'])
                     # Resize image to fit page
                     max_width = wrap_width - 20
-                    max_height = 350
+                    max_height = EPUB_IMAGE_MAX_SIZE[1]
                     
                     ratio = min(max_width / img.width, max_height / img.height, 1.0)
                     new_size = (int(img.width * ratio), int(img.height * ratio))
                     
-                    ctk_img = ctk.CTkImage(
-                        light_image=img,
-                        dark_image=img,
-                        size=new_size
-                    )
+                    # Reuse the CTkImage (and its Tk photo) from the last time it was shown at this size
+                    photo_key = (item['image_key'], new_size)
+                    ctk_img = self._epub_photo_cache.get(photo_key)
+                    if ctk_img is not None:
+                        self._epub_photo_cache.move_to_end(photo_key)
+                    else:
+                        # Shrink to device pixels once here (reducing_gap
+                        # box-reduces first), so CTkImage's own resize is a copy
+                        scaling = self._get_widget_scaling()
+                        device_size = (round(new_size[0] * scaling), round(new_size[1] * scaling))
+                        if device_size != img.size:
+                            img = img.resize(device_size, Image.LANCZOS, reducing_gap=2.0)
+                        ctk_img = ctk.CTkImage(
+                            light_image=img,
+                            dark_image=img,
+                            size=new_size
+                        )
+                        self._epub_photo_cache[photo_key] = ctk_img
+                        if len(self._epub_photo_cache) > EPUB_PHOTO_CACHE_SIZE:
+                            self._epub_photo_cache.popitem(last=False)
                     
-                    img_label = ctk.CTkLabel(
-                        container,
-                        text="",
-                        image=ctk_img
-                    )
+                    if pool["image"]:
+                        img_label = pool["image"].pop()
+                        img_label.configure(image=ctk_img)
+                    else:
+                        img_label = ctk.CTkLabel(
+                            container,
+                            text="",
+                            image=ctk_img
+                        )
                     img_label._ctk_image = ctk_img  # Keep reference
                     img_label.pack(pady=20)
-                    widget_list.append(img_label)
+                    widget_list.append(("image", img_label))
                 except Exception:
                     pass  # Skip image display errors
     
@@ -948,71 +1310,164 @@ class ReaderPage(ctk.CTkFrame):
         else:
             self.right_pdf_image.configure(image=None, text="")
             self.right_page_num.configure(text="")
+        
+        # Render the next spread (then the previous one) while this one is being read
+        self._prerender_pdf_pages(
+            (left_idx + 2, left_idx + 3, left_idx - 2, left_idx - 1), page_width - 80, page_height - 100
+        )
+    
+    def _pdf_cache_key(self, page_num: int, max_width: int, max_height: int) -> tuple:
+        """Get the cache key for a page, with the size snapped to PDF_SIZE_STEP."""
+        max_width = max(PDF_SIZE_STEP, max_width // PDF_SIZE_STEP * PDF_SIZE_STEP)
+        max_height = max(PDF_SIZE_STEP, max_height // PDF_SIZE_STEP * PDF_SIZE_STEP)
+        return (page_num, max_width, max_height)
+    
+    def _prerender_pdf_pages(self, page_nums, max_width: int, max_height: int):
+        """Queue background renders of pages that are likely to be shown next."""
+        wanted = set()
+        for page_num in page_nums:
+            cache_key = self._pdf_cache_key(page_num, max_width, max_height)
+            if not 0 <= page_num < self.pdf_doc.page_count or cache_key in self._pdf_page_cache:
+                continue
+            wanted.add(cache_key)
+            if cache_key not in self._pdf_prerendered:
+                self._pdf_prerendered[cache_key] = self._prefetch_executor.submit(
+                    self._rasterize_pdf_page, self.pdf_doc, *cache_key
+                )
+        
+        # Drop renders queued for spreads the reader has moved away from
+        for cache_key in [k for k in self._pdf_prerendered if k not in wanted]:
+            self._pdf_prerendered.pop(cache_key).cancel()
+    
+    def _close_pdf(self):
+        """Drop cached and pending renders and close the open PDF."""
+        self._pdf_page_cache.clear()
+        self._pdf_cache_bytes = 0
+        for future in self._pdf_prerendered.values():
+            future.cancel()
+        self._pdf_prerendered.clear()
+        
+        if self.pdf_doc:
+            # Trim the page cache on disk now that this book's pages are written
+            _CACHE_WRITER.submit(page_cache.prune)
+            with self._pdf_lock:
+                self.pdf_doc.close()
+                # Release the fonts and images MuPDF cached for this document
+                fitz.TOOLS.store_shrink(100)
+            self.pdf_doc = None
+    
+    def _rasterize_pdf_page(self, doc, page_num: int, max_width: int, max_height: int) -> Image.Image:
+        """Render a PDF page to a PIL image fitting the given box. Safe to call off the Tk thread."""
+        # Pages rendered in an earlier session are read back from disk
+        img = page_cache.get_page(doc.name, page_num, (max_width, max_height))
+        if img is not None:
+            return img
+        
+        with self._pdf_lock:
+            page = doc[page_num]
+            
+            # Calculate scale to fit
+            rect = page.rect
+            scale_w = max_width / rect.width
+            scale_h = max_height / rect.height
+            scale = min(scale_w, scale_h)
+            
+            mat = fitz.Matrix(scale, scale)
+            # Packed 3-byte RGB, whatever the page's own colorspace
+            pix = page.get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False)
+        
+        # Wrap MuPDF's raw samples directly (no PNG encode/decode round trip)
+        img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples_mv)
+        
+        # Encoding for the disk cache happens on the cache writer thread
+        _CACHE_WRITER.submit(page_cache.put_page, doc.name, page_num, (max_width, max_height), img)
+        return img
     
     def _render_pdf_page(self, page_num: int, label: ctk.CTkLabel, max_width: int, max_height: int):
         """Render a PDF page to a label with caching."""
         # Check cache first
-        cache_key = (page_num, max_width, max_height)
+        cache_key = self._pdf_cache_key(page_num, max_width, max_height)
         if cache_key in self._pdf_page_cache:
-            photo = self._pdf_page_cache[cache_key]
-            label.configure(image=photo)
-            label.image = photo
+            self._pdf_page_cache.move_to_end(cache_key)
+            self._show_pdf_photo(label, self._pdf_page_cache[cache_key][0])
             return
         
-        page = self.pdf_doc[page_num]
-        
-        # Calculate scale to fit
-        rect = page.rect
-        scale_w = max_width / rect.width
-        scale_h = max_height / rect.height
-        scale = min(scale_w, scale_h)
-        
-        mat = fitz.Matrix(scale, scale)
-        pix = page.get_pixmap(matrix=mat)
-        
-        img = Image.open(io.BytesIO(pix.tobytes("png")))
-        
-        photo = ctk.CTkImage(
-            light_image=img,
-            dark_image=img,
-            size=(int(rect.width * scale), int(rect.height * scale))
-        )
-        
-        # Cache the rendered page (limit cache size to 20 pages)
-        if len(self._pdf_page_cache) > 20:
-            # Remove oldest entry
-            self._pdf_page_cache.pop(next(iter(self._pdf_page_cache)))
-        self._pdf_page_cache[cache_key] = photo
-        
-        label.configure(image=photo)
+        # Use the background render if one was started, otherwise render now
+        future = self._pdf_prerendered.pop(cache_key, None)
+        if future is not None and not future.cancel():
+            img = future.result()
+        else:
+            img = self._rasterize_pdf_page(self.pdf_doc, *cache_key)
+        
+        # Photos must be created on the Tk thread. The page is already rendered
+        # at screen pixels and looks the same in light and dark mode, so a
+        # plain PhotoImage is shown as is (a CTkImage would also keep the PIL
+        # image alive and rescale it)
+        photo = ImageTk.PhotoImage(img)
+        
+        # Cache the rendered page, within the memory budget (Tk stores 4 bytes per pixel)
+        size_bytes = img.width * img.height * 4
+        self._pdf_page_cache[cache_key] = (photo, size_bytes)
+        self._pdf_cache_bytes += size_bytes
+        while self._pdf_cache_bytes > PDF_CACHE_BYTES and len(self._pdf_page_cache) > 1:
+            # Remove least recently used entry
+            _, (_, freed_bytes) = self._pdf_page_cache.popitem(last=False)
+            self._pdf_cache_bytes -= freed_bytes
+        
+        self._show_pdf_photo(label, photo)
+    
+    def _show_pdf_photo(self, label: ctk.CTkLabel, photo):
+        """Show a rendered PDF page in a label."""
+        # PDF pages are plain PhotoImages at screen pixels on purpose, so
+        # CTkLabel's warning about non-CTkImage images is silenced here only
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="CTkLabel Warning: Given image is not CTkImage")
+            label.configure(image=photo)
         label.image = photo  # Keep reference
     
+    def _set_pages(self, pages):
+        """Set the paginated content along with the page and spread counts derived from it."""
+        self.pages = pages
+        self.total_pages = total_pages = len(pages)
+        
+        # Two pages per spread (the last may be half empty); always at least one spread
+        self._total_spreads = max(1, (total_pages + 1) >> 1)
+        self._max_spread = max(0, (total_pages - 1) >> 1)
+    
     def _update_navigation(self):
         """Update navigation controls."""
-        # Calculate spread count (two pages per spread)
-        if self.file_type == "epub":
-            total_spreads = (len(self.pages) + 1) // 2
-            current_spread = self.current_page
-        else:
-            total_spreads = (self.total_pages + 1) // 2
-            current_spread = self.current_page
+        # Nothing to do if the position and page count are as last shown
+        nav_key = (self.current_page, self.total_pages, self.file_type)
+        if nav_key == self._last_nav_key:
+            return
+        self._last_nav_key = nav_key
         
-        if total_spreads == 0:
-            total_spreads = 1
+        total_spreads = self._total_spreads
+        current_spread = self.current_page
         
-        self.page_label.configure(
-            text=f"Pages {self.current_page * 2 + 1}-{min(self.current_page * 2 + 2, self.total_pages)} of {self.total_pages}"
-        )
+        # Only touch widgets whose value actually changed
+        page_text = f"Pages {self.current_page * 2 + 1}-{min(self.current_page * 2 + 2, self.total_pages)} of {self.total_pages}"
+        if page_text != self._last_page_label_text:
+            self.page_label.configure(text=page_text)
+            self._last_page_label_text = page_text
         
         if total_spreads > 1:
             progress = (current_spread / (total_spreads - 1)) * 100
         else:
             progress = 100
-        self.progress_slider.set(progress)
+        if abs(progress - self._last_progress) >= 0.1:
+            self.progress_slider.set(progress)
+            self._last_progress = progress
         
         # Enable/disable buttons
-        self.prev_btn.configure(state="normal" if self.current_page > 0 else "disabled")
-        self.next_btn.configure(state="normal" if self.current_page < total_spreads - 1 else "disabled")
+        button_states = (
+            "normal" if self.current_page > 0 else "disabled",
+            "normal" if self.current_page < total_spreads - 1 else "disabled"
+        )
+        if button_states != self._last_button_states:
+            self.prev_btn.configure(state=button_states[0])
+            self.next_btn.configure(state=button_states[1])
+            self._last_button_states = button_states
     
     def _prev_page(self):
         """Go to previous spread."""
@@ -1022,41 +1477,60 @@ class ReaderPage(ctk.CTkFrame):
     
     def _next_page(self):
         """Go to next spread."""
-        if self.file_type == "epub":
-            max_spread = (len(self.pages) + 1) // 2 - 1
-        else:
-            max_spread = (self.total_pages + 1) // 2 - 1
-        
-        if self.current_page < max_spread:
+        if self.current_page < self._max_spread:
             self.current_page += 1
             self._show_current_spread()
     
     def _on_slider_change(self, value):
         """Handle slider change."""
-        if self.file_type == "epub":
-            total_spreads = (len(self.pages) + 1) // 2
-        else:
-            total_spreads = (self.total_pages + 1) // 2
+        self._pending_spread = int((value / 100) * self._max_spread)
         
-        if total_spreads > 1:
-            new_spread = int((value / 100) * (total_spreads - 1))
-        else:
-            new_spread = 0
-        
-        if new_spread != self.current_page:
+        # Coalesce a drag into one render of the last position
+        if self._slider_job is not None:
+            self.after_cancel(self._slider_job)
+        self._slider_job = self.after(SLIDER_SETTLE_MS, self._apply_pending_spread)
+    
+    def _apply_pending_spread(self, event=None):
+        """Show the spread last picked on the slider."""
+        if self._slider_job is not None:
+            self.after_cancel(self._slider_job)
+            self._slider_job = None
+        
+        new_spread, self._pending_spread = self._pending_spread, None
+        if new_spread is not None and new_spread != self.current_page:
             self.current_page = new_spread
             self._show_current_spread()
     
     def _save_progress(self):
-        """Save reading progress."""
-        if self.book_data:
+        """Queue reading progress to be saved with the next batch."""
+        # Until pagination finishes the page count is partial; it saves on completion
+        if self.book_data and self._pagination is None:
             current = self.current_page * 2
-            total = self.total_pages if self.file_type == "epub" else self.pdf_doc.page_count if self.pdf_doc else 0
-            database.update_reading_progress(
-                self.book_data["id"],
-                current,
-                total
+            book_id = self.book_data["id"]
+            self._pending_progress[book_id] = (book_id, current, self.total_pages)
+            
+            if self._progress_job is None:
+                self._progress_job = self.after(PROGRESS_FLUSH_MS, self._flush_progress)
+    
+    def _flush_progress(self, wait: bool = False):
+        """Write queued progress on the database thread in one transaction."""
+        if self._progress_job is not None:
+            self.after_cancel(self._progress_job)
+            self._progress_job = None
+        
+        if self._pending_progress:
+            saved = database.query_async(
+                database.update_reading_progress_bulk, list(self._pending_progress.values())
             )
+            self._pending_progress = {}
+            if wait:
+                saved.result()
+    
+    def _on_destroy(self, event):
+        """Save any queued progress when the window closes."""
+        if event.widget is self:
+            # The process is about to exit, so wait for the write
+            self._flush_progress(wait=True)
     
     def _decrease_font(self):
         """Decrease font size."""
@@ -1071,11 +1545,19 @@ class ReaderPage(ctk.CTkFrame):
             self._update_font()
     
     def _update_font(self):
+        """Repaginate for the new font size once the clicks stop."""
+        if self._font_job is not None:
+            self.after_cancel(self._font_job)
+        self._font_job = self.after(FONT_SETTLE_MS, self._apply_font)
+    
+    def _apply_font(self):
         """Update font and repaginate."""
+        self._font_job = None
+        
         # Just repaginate - widgets are recreated with new font on display
         if self.file_type == "epub":
-            self._repaginate_epub()
             self.current_page = 0
+            self._repaginate_epub()
             self._show_current_spread()
     
     def _toggle_favorite(self):
@@ -1085,6 +1567,14 @@ class ReaderPage(ctk.CTkFrame):
             self.fav_btn.configure(text="❤️" if is_fav else "♡")
             self.book_data["is_favorite"] = 1 if is_fav else 0
     
+    def _on_link_click(self, textbox, event):
+        """Open the URL of the link clicked in a page textbox."""
+        for tag_name in textbox.tag_names("current"):
+            url = textbox._link_urls.get(tag_name)
+            if url:
+                self._open_link(url)
+                return
+    
     def _open_link(self, url):
         """Open a link in the system's default web browser."""
         if url:
@@ -1095,9 +1585,10 @@ class ReaderPage(ctk.CTkFrame):
     
     def _on_back(self):
         """Handle back button."""
-        if self.pdf_doc:
-            self.pdf_doc.close()
-            self.pdf_doc = None
+        # Queued ahead of the library's refresh query, so it sees the new progress
+        self._flush_progress()
+        self._cancel_pagination()
+        self._close_pdf()
         self.on_back()
     
     def _toggle_toc(self):
@@ -1121,6 +1612,9 @@ class ReaderPage(ctk.CTkFrame):
         if not hasattr(self, '_toc_expanded'):
             self._toc_expanded = {}
         
+        # Sections with children: entry id -> (toggle button, children frame, children, depth)
+        self._toc_nodes = {}
+        
         if not self.toc_entries:
             # No TOC found message
             ctk.CTkLabel(
@@ -1138,7 +1632,6 @@ class ReaderPage(ctk.CTkFrame):
         """Recursively create TOC items with collapsible children."""
         for i, entry in enumerate(entries):
             title = entry.get('title', f'Chapter {i + 1}')
-            page_idx = entry.get('page_index', 0)
             children = entry.get('children', [])
             entry_id = f"{depth}_{i}_{title[:20]}"
             
@@ -1168,8 +1661,7 @@ class ReaderPage(ctk.CTkFrame):
                     text_color=("#8E8E93", "#8E8E93"),
                     hover_color=("#E5E5EA", "#38383A"),
                     corner_radius=4,
-                    command=lambda eid=entry_id, cont=item_container, ch=children, d=depth: 
-                        self._toggle_toc_section(eid, cont, ch, d)
+                    command=partial(self._toggle_toc_section, entry_id)
                 )
                 toggle_btn.pack(side="left", padx=(4, 0))
             else:
@@ -1192,7 +1684,7 @@ class ReaderPage(ctk.CTkFrame):
                 text_color=("#1D1D1F", "#F5F5F7") if depth == 0 else ("#48484A", "#AEAEB2"),
                 hover_color=("#E5E5EA", "#38383A"),
                 corner_radius=8,
-                command=lambda idx=page_idx: self._navigate_to_chapter(idx)
+                command=partial(self._navigate_to_entry, entry)
             )
             title_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
             
@@ -1200,30 +1692,37 @@ class ReaderPage(ctk.CTkFrame):
             if children:
                 children_frame = ctk.CTkFrame(item_container, fg_color="transparent")
                 children_frame._toc_children = True  # Mark for identification
+                self._toc_nodes[entry_id] = (toggle_btn, children_frame, children, depth)
                 
                 if self._toc_expanded.get(entry_id, False):
                     children_frame.pack(fill="x")
                     self._create_toc_items(children, children_frame, depth + 1)
     
-    def _toggle_toc_section(self, entry_id, container, children, depth):
+    def _toggle_toc_section(self, entry_id):
         """Toggle a TOC section expanded/collapsed."""
-        is_expanded = self._toc_expanded.get(entry_id, False)
-        self._toc_expanded[entry_id] = not is_expanded
-        
-        # Rebuild the TOC to reflect changes
-        self._populate_toc()
+        is_expanded = not self._toc_expanded.get(entry_id, False)
+        self._toc_expanded[entry_id] = is_expanded
+        
+        # Show or hide just this section, building its children on first expand
+        toggle_btn, children_frame, children, depth = self._toc_nodes[entry_id]
+        toggle_btn.configure(text="▼" if is_expanded else "▶")
+        if is_expanded:
+            if not children_frame.winfo_children():
+                self._create_toc_items(children, children_frame, depth + 1)
+            children_frame.pack(fill="x")
+        else:
+            children_frame.pack_forget()
+    
+    def _navigate_to_entry(self, entry):
+        """Navigate to a TOC entry's page as of the latest pagination."""
+        self._navigate_to_chapter(entry.get('page_index', 0))
     
     def _navigate_to_chapter(self, page_index):
         """Navigate to a specific chapter/page."""
         # Convert page index to spread index
         spread_index = page_index // 2
         
-        if self.file_type == "epub":
-            max_spread = (len(self.pages) + 1) // 2 - 1
-        else:
-            max_spread = (self.total_pages + 1) // 2 - 1
-        
-        self.current_page = min(spread_index, max(0, max_spread))
+        self.current_page = min(spread_index, self._max_spread)
         self._show_current_spread()
         
         # Close TOC panel after navigation
@@ -1238,7 +1737,7 @@ class ReaderPage(ctk.CTkFrame):
             # Try to get TOC from EPUB
             toc = book.toc
             if toc:
-                self._parse_toc_items(toc)
+                self.toc_entries = self._parse_toc_items(toc)
         except Exception:
             pass
         
@@ -1256,21 +1755,19 @@ class ReaderPage(ctk.CTkFrame):
                 if hasattr(section, 'title'):
                     entry = {
                         'title': section.title,
-                        'page_index': len(self.toc_entries),
+                        'page_index': 0,  # Placed by _update_toc_page_indices
                         'depth': depth,
-                        'children': []
+                        'children': self._parse_toc_items(children, depth + 1) if children else []
                     }
-                    self.toc_entries.append(entry)
-                    if children:
-                        entry['children'] = self._parse_toc_items(children, depth + 1)
+                    result.append(entry)
             elif hasattr(item, 'title'):
                 entry = {
                     'title': item.title,
-                    'page_index': len(self.toc_entries),
+                    'page_index': 0,
                     'depth': depth,
                     'children': []
                 }
-                self.toc_entries.append(entry)
+                result.append(entry)
         return result
     
     def _generate_toc_from_headers(self):
@@ -1338,19 +1835,30 @@ class ReaderPage(ctk.CTkFrame):
                 items_on_page = 0
     
     def _update_toc_page_indices(self):
-        """Update TOC entries with actual page indices after pagination."""
+        """Update TOC entries, nested ones included, with actual page indices after pagination."""
         if not self.toc_entries or not self.pages:
             return
         
-        # Build a map of header text to page index
+        # Every entry at any depth, and the titles to look for
+        entries = []
+        pending = list(self.toc_entries)
+        while pending:
+            entry = pending.pop()
+            entries.append(entry)
+            pending.extend(entry.get('children', []))
+        titles = {entry['title'].strip() for entry in entries}
+        
+        # Build a map of header text to page index, stopping once every title is found
         header_to_page = {}
         for page_idx, page_items in enumerate(self.pages):
             for item in page_items:
-                if item['type'] == 'text' and item.get('is_header', False):
-                    header_to_page[item['text']] = page_idx
+                if item['type'] == 'text' and item.get('is_header', False) and item['text'] in titles:
+                    header_to_page.setdefault(item['text'], page_idx)
+            if len(header_to_page) == len(titles):
+                break
         
         # Update TOC entries with correct page indices
-        for entry in self.toc_entries:
+        for entry in entries:
             title = entry['title'].strip()
             if title in header_to_page:
                 entry['page_index'] = header_to_page[title]
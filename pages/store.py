@@ -5,10 +5,197 @@ Import and manage books (EPUB and PDF).
 
 import customtkinter as ctk
 from tkinter import filedialog
+import io
 import os
+import multiprocessing
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from urllib.parse import unquote
+from concurrent.futures import ProcessPoolExecutor
 import database
+from components.fonts import font
 from ebooklib import epub
 import fitz  # PyMuPDF
+from PIL import Image
+
+# EPUB parsing is CPU-bound, so files are read in up to this many
+# worker processes
+IMPORT_WORKERS = min(os.cpu_count() or 1, 4)
+
+# How often the page checks on files being imported
+IMPORT_POLL_MS = 50
+
+# EPUB covers larger than this are re-encoded as JPEG within COVER_MAX_SIZE
+# (some books ship multi-megabyte PNG covers, and only thumbnails are shown)
+COVER_MAX_BYTES = 256 * 1024
+COVER_MAX_SIZE = (600, 900)
+COVER_JPEG_QUALITY = 80
+
+# Icon, name and description for each supported format's info card
+FORMAT_CARDS = (
+    ("📖", "EPUB", "Standard e-book format with reflowable text, chapters, and metadata support."),
+    ("📄", "PDF", "Portable Document Format with fixed layout, images, and page navigation."),
+)
+
+# XML namespaces used by an EPUB's container and package (OPF) files
+_CONTAINER_NS = "{urn:oasis:names:tc:opendocument:xmlns:container}"
+_OPF_NS = "{http://www.idpf.org/2007/opf}"
+_DC_NS = "{http://purl.org/dc/elements/1.1/}"
+
+
+def _compact_cover(data: bytes) -> bytes:
+    """Shrink an oversized cover image to a JPEG, keeping the original if that doesn't help."""
+    if len(data) <= COVER_MAX_BYTES:
+        return data
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.draft("RGB", COVER_MAX_SIZE)
+            image = image.convert("RGB")
+        image.thumbnail(COVER_MAX_SIZE)
+        
+        out = io.BytesIO()
+        image.save(out, "JPEG", quality=COVER_JPEG_QUALITY)
+        return out.getvalue() if out.tell() < len(data) else data
+    except Exception:
+        return data  # Unreadable here; store it as is
+
+
+def _process_epub(file_path: str) -> tuple:
+    """Read an EPUB into a row for database.add_books_bulk. Runs in an import worker process."""
+    try:
+        return _read_epub_package(file_path)
+    except Exception:
+        # Malformed package files still open with ebooklib's full parse
+        return _read_epub_full(file_path)
+
+
+def _read_epub_package(file_path: str) -> tuple:
+    """Read an EPUB's metadata and cover straight from its OPF, without loading every item."""
+    with zipfile.ZipFile(file_path) as archive:
+        container = ET.fromstring(archive.read("META-INF/container.xml"))
+        opf_path = container.find(f".//{_CONTAINER_NS}rootfile").get("full-path")
+        package = ET.fromstring(archive.read(opf_path))
+        opf_dir = posixpath.dirname(opf_path)
+        
+        metadata = package.find(f"{_OPF_NS}metadata")
+        
+        def dc(name: str) -> str:
+            element = metadata.find(f"{_DC_NS}{name}")
+            return (element.text or "").strip() if element is not None else ""
+        
+        title = dc("title") or os.path.basename(file_path).replace('.epub', '')
+        author = dc("creator") or "Unknown Author"
+        description = dc("description")
+        
+        items = package.findall(f"{_OPF_NS}manifest/{_OPF_NS}item")
+        images = [item for item in items
+                  if (item.get("media-type") or "").startswith("image/")]
+        
+        # Cover named in the OPF metadata (EPUB 2) or manifest properties
+        # (EPUB 3), else an image with 'cover' in its name, else the first image
+        cover_id = next((meta.get("content") for meta in metadata.iter(f"{_OPF_NS}meta")
+                         if meta.get("name") == "cover"), None)
+        cover_item = (
+            next((item for item in images if item.get("id") == cover_id), None)
+            or next((item for item in images
+                     if "cover-image" in (item.get("properties") or "").split()), None)
+            or next((item for item in images
+                     if "cover" in (item.get("href") or "").lower()), None)
+            or (images[0] if images else None)
+        )
+        
+        cover_image = None
+        if cover_item is not None:
+            href = posixpath.normpath(posixpath.join(opf_dir, unquote(cover_item.get("href"))))
+            try:
+                cover_image = _compact_cover(archive.read(href))
+            except KeyError:
+                pass  # Manifest points at a missing file
+        
+        # Chapters are the documents in reading order
+        total_pages = len(package.findall(f"{_OPF_NS}spine/{_OPF_NS}itemref")) or len(items)
+    
+    return (title, author, file_path, "epub", cover_image, description,
+            "General", total_pages)
+
+
+def _read_epub_full(file_path: str) -> tuple:
+    """Read an EPUB's metadata and cover by loading the whole book with ebooklib."""
+    book = epub.read_epub(file_path)
+    
+    # Extract metadata
+    title = book.get_metadata('DC', 'title')
+    title = title[0][0] if title else os.path.basename(file_path).replace('.epub', '')
+    
+    author = book.get_metadata('DC', 'creator')
+    author = author[0][0] if author else "Unknown Author"
+    
+    description = book.get_metadata('DC', 'description')
+    description = description[0][0] if description else ""
+    
+    # Most books name their cover image in the OPF metadata
+    cover_item = None
+    for _, attrs in book.get_metadata('OPF', 'cover'):
+        item = book.get_item_with_id((attrs or {}).get('content', ''))
+        if item is not None and (item.media_type or '').startswith('image/'):
+            cover_item = item
+            break
+    
+    # Otherwise use an image with 'cover' in its name, or else the first
+    # image; chapters (document items) are counted in the same pass
+    image_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp')
+    named_cover = first_image = None
+    total_pages = 0
+    item_count = 0
+    for item in book.get_items():
+        item_count += 1
+        if item.get_type() == 9:  # DOCUMENT type
+            total_pages += 1
+            continue
+        if cover_item is not None:
+            continue
+        
+        item_name = (item.get_name() or '').lower()
+        media_type = item.media_type or ''
+        if named_cover is None and 'cover' in item_name and (
+                media_type.startswith('image/') or item_name.endswith(image_extensions)):
+            named_cover = item
+        if first_image is None and media_type.startswith('image/'):
+            first_image = item
+    if total_pages == 0:
+        total_pages = item_count
+    
+    cover_image = None
+    if cover_item is None:
+        cover_item = named_cover if named_cover is not None else first_image
+    if cover_item is not None:
+        try:
+            cover_image = _compact_cover(cover_item.get_content())
+        except Exception:
+            pass
+    
+    return (title, author, file_path, "epub", cover_image, description,
+            "General", total_pages)
+
+
+def _process_pdf(file_path: str) -> tuple:
+    """Read a PDF into a row for database.add_books_bulk. Runs in an import worker process."""
+    doc = fitz.open(file_path)
+    
+    # Extract metadata
+    metadata = doc.metadata
+    title = metadata.get('title', '') or os.path.basename(file_path).replace('.pdf', '')
+    author = metadata.get('author', '') or "Unknown Author"
+    
+    # Get page count
+    total_pages = doc.page_count
+    
+    doc.close()
+    
+    # No cover: the library renders one from the first page when it is first shown
+    return (title, author, file_path, "pdf", None, "",
+            "General", total_pages)
 
 
 class StorePage(ctk.CTkScrollableFrame):
@@ -28,7 +215,7 @@ class StorePage(ctk.CTkScrollableFrame):
         title = ctk.CTkLabel(
             header,
             text="Book Store",
-            font=ctk.CTkFont(family="Segoe UI", size=32, weight="bold"),
+            font=font(32, "bold", "Segoe UI"),
             text_color=("#1D1D1F", "#F5F5F7")
         )
         title.pack(anchor="w")
@@ -36,7 +223,7 @@ class StorePage(ctk.CTkScrollableFrame):
         subtitle = ctk.CTkLabel(
             header,
             text="Import your EPUB and PDF books",
-            font=ctk.CTkFont(size=14),
+            font=font(14),
             text_color=("#86868B", "#86868B")
         )
         subtitle.pack(anchor="w", pady=(5, 0))
@@ -59,14 +246,14 @@ class StorePage(ctk.CTkScrollableFrame):
         import_icon = ctk.CTkLabel(
             import_content,
             text="📥",
-            font=ctk.CTkFont(size=48)
+            font=font(48)
         )
         import_icon.pack(pady=(0, 15))
         
         import_title = ctk.CTkLabel(
             import_content,
             text="Import Books",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=font(20, "bold"),
             text_color=("#1D1D1F", "#F5F5F7")
         )
         import_title.pack()
@@ -74,7 +261,7 @@ class StorePage(ctk.CTkScrollableFrame):
         import_desc = ctk.CTkLabel(
             import_content,
             text="Add EPUB or PDF files from your computer",
-            font=ctk.CTkFont(size=14),
+            font=font(14),
             text_color=("#86868B", "#86868B")
         )
         import_desc.pack(pady=(5, 20))
@@ -89,7 +276,7 @@ class StorePage(ctk.CTkScrollableFrame):
             width=150,
             height=44,
             corner_radius=22,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=font(14, "bold"),
             fg_color=("#007AFF", "#0A84FF"),
             hover_color=("#0056B3", "#0066CC"),
             command=self._import_epub
@@ -102,7 +289,7 @@ class StorePage(ctk.CTkScrollableFrame):
             width=150,
             height=44,
             corner_radius=22,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=font(14, "bold"),
             fg_color=("#FF3B30", "#FF453A"),
             hover_color=("#CC2F26", "#CC372E"),
             command=self._import_pdf
@@ -116,7 +303,7 @@ class StorePage(ctk.CTkScrollableFrame):
         formats_title = ctk.CTkLabel(
             formats_frame,
             text="Supported Formats",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=font(18, "bold"),
             text_color=("#1D1D1F", "#F5F5F7")
         )
         formats_title.pack(anchor="w", pady=(0, 15))
@@ -125,16 +312,14 @@ class StorePage(ctk.CTkScrollableFrame):
         formats_grid = ctk.CTkFrame(formats_frame, fg_color="transparent")
         formats_grid.pack(fill="x")
         
-        self._create_format_card(formats_grid, "📖", "EPUB", 
-            "Standard e-book format with reflowable text, chapters, and metadata support.", 0)
-        self._create_format_card(formats_grid, "📄", "PDF",
-            "Portable Document Format with fixed layout, images, and page navigation.", 1)
+        for col, (icon, title, desc) in enumerate(FORMAT_CARDS):
+            self._create_format_card(formats_grid, icon, title, desc, col)
         
         # Status label
         self.status_label = ctk.CTkLabel(
             self,
             text="",
-            font=ctk.CTkFont(size=14),
+            font=font(14),
             text_color=("#34C759", "#30D158")
         )
         self.status_label.pack(pady=20)
@@ -155,14 +340,14 @@ class StorePage(ctk.CTkScrollableFrame):
         icon_label = ctk.CTkLabel(
             content,
             text=icon,
-            font=ctk.CTkFont(size=32)
+            font=font(32)
         )
         icon_label.pack(anchor="w")
         
         title_label = ctk.CTkLabel(
             content,
             text=title,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=font(16, "bold"),
             text_color=("#1D1D1F", "#F5F5F7")
         )
         title_label.pack(anchor="w", pady=(10, 5))
@@ -170,7 +355,7 @@ class StorePage(ctk.CTkScrollableFrame):
         desc_label = ctk.CTkLabel(
             content,
             text=desc,
-            font=ctk.CTkFont(size=12),
+            font=font(12),
             text_color=("#86868B", "#86868B"),
             wraplength=240,
             justify="left"
@@ -185,20 +370,7 @@ class StorePage(ctk.CTkScrollableFrame):
         )
         
         if files:
-            imported = 0
-            for file_path in files:
-                try:
-                    self._process_epub(file_path)
-                    imported += 1
-                except Exception as e:
-                    print(f"Error importing {file_path}: {e}")
-            
-            if imported > 0:
-                self.status_label.configure(
-                    text=f"✓ Successfully imported {imported} EPUB file(s)",
-                    text_color=("#34C759", "#30D158")
-                )
-                self.on_import_complete()
+            self._start_import(files, _process_epub, "EPUB")
     
     def _import_pdf(self):
         """Import PDF files."""
@@ -208,109 +380,98 @@ class StorePage(ctk.CTkScrollableFrame):
         )
         
         if files:
-            imported = 0
-            for file_path in files:
-                try:
-                    self._process_pdf(file_path)
-                    imported += 1
-                except Exception as e:
-                    print(f"Error importing {file_path}: {e}")
-            
-            if imported > 0:
-                self.status_label.configure(
-                    text=f"✓ Successfully imported {imported} PDF file(s)",
-                    text_color=("#34C759", "#30D158")
-                )
-                self.on_import_complete()
+            self._start_import(files, _process_pdf, "PDF")
     
-    def _process_epub(self, file_path: str):
-        """Process and add EPUB to database."""
-        book = epub.read_epub(file_path)
-        
-        # Extract metadata
-        title = book.get_metadata('DC', 'title')
-        title = title[0][0] if title else os.path.basename(file_path).replace('.epub', '')
-        
-        author = book.get_metadata('DC', 'creator')
-        author = author[0][0] if author else "Unknown Author"
-        
-        description = book.get_metadata('DC', 'description')
-        description = description[0][0] if description else ""
+    def _start_import(self, files, process, kind: str):
+        """Look up which files are new, then import those."""
+        lookup = database.query_async(database.get_existing_paths, files)
+        self.after(IMPORT_POLL_MS, self._poll_existing, lookup, files, process, kind)
+    
+    def _poll_existing(self, lookup, files, process, kind: str):
+        """Skip files already in the library, so they are not parsed again (Tk thread only)."""
+        if not lookup.done():
+            self.after(IMPORT_POLL_MS, self._poll_existing, lookup, files, process, kind)
+            return
+        
+        try:
+            existing = lookup.result()
+        except Exception as e:
+            self._show_import_error(kind, e)
+            return
+        files = [file_path for file_path in files if file_path not in existing]
+        if not files:
+            self.status_label.configure(
+                text=f"{kind} file(s) already in your library",
+                text_color=("#86868B", "#86868B")
+            )
+            return
+        self._process_files(files, process, kind)
+    
+    def _process_files(self, files, process, kind: str):
+        """Read files in worker processes and add them once all are done."""
+        # Spawned, not forked: a fork would copy locks held by the Tk, database
+        # and cover-rendering threads, and could deadlock the worker
+        pool = ProcessPoolExecutor(
+            max_workers=min(IMPORT_WORKERS, len(files)),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        futures = {pool.submit(process, file_path): file_path for file_path in files}
+        # Submitted files still run; this just lets the workers exit afterwards
+        pool.shutdown(wait=False)
         
-        # Extract cover image using multiple methods
-        cover_image = None
-        image_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp')
-        
-        # Method 1: Look for item with 'cover' in name
-        for item in book.get_items():
-            item_name = (item.get_name() or '').lower()
-            media_type = item.media_type or ''
-            
-            # Check if it's an image
-            is_image = media_type.startswith('image/') or item_name.endswith(image_extensions)
-            
-            if is_image and 'cover' in item_name:
-                try:
-                    cover_image = item.get_content()
-                    break
-                except Exception:
-                    pass
-        
-        # Method 2: If no cover found, look for first image with 'cover' in any attribute
-        if cover_image is None:
-            for item in book.get_items():
-                media_type = item.media_type or ''
-                if media_type.startswith('image/'):
-                    try:
-                        cover_image = item.get_content()
-                        break  # Use first image as fallback cover
-                    except Exception:
-                        pass
-        
-        # Count chapters (document items)
-        total_pages = 0
-        for item in book.get_items():
-            if item.get_type() == 9:  # DOCUMENT type
-                total_pages += 1
-        if total_pages == 0:
-            total_pages = len(list(book.get_items()))
-        
-        database.add_book(
-            title=title,
-            author=author,
-            file_path=file_path,
-            file_type="epub",
-            cover_image=cover_image,
-            description=description,
-            total_pages=total_pages
+        self.status_label.configure(
+            text=f"Importing {len(files)} {kind} file(s)...",
+            text_color=("#86868B", "#86868B")
         )
+        self.after(IMPORT_POLL_MS, self._poll_import, futures, kind)
     
-    def _process_pdf(self, file_path: str):
-        """Process and add PDF to database."""
-        doc = fitz.open(file_path)
-        
-        # Extract metadata
-        metadata = doc.metadata
-        title = metadata.get('title', '') or os.path.basename(file_path).replace('.pdf', '')
-        author = metadata.get('author', '') or "Unknown Author"
-        
-        # Get page count
-        total_pages = doc.page_count
-        
-        # Extract first page as cover
-        cover_image = None
-        if total_pages > 0:
-            page = doc[0]
-            pix = page.get_pixmap(matrix=fitz.Matrix(0.5, 0.5))
-            cover_image = pix.tobytes("png")
-        
-        doc.close()
-        
-        database.add_book(
-            title=title,
-            author=author,
-            file_path=file_path,
-            file_type="pdf",
-            cover_image=cover_image,
-            total_pages=total_pages
+    def _poll_import(self, futures: dict, kind: str):
+        """Report import progress, then queue the books' insert (Tk thread only)."""
+        done = sum(future.done() for future in futures)
+        if done < len(futures):
+            self.status_label.configure(text=f"Importing {kind} files... {done} of {len(futures)}")
+            self.after(IMPORT_POLL_MS, self._poll_import, futures, kind)
+            return
+        
+        rows = []
+        for future, file_path in futures.items():
+            try:
+                rows.append(future.result())
+            except Exception as e:
+                print(f"Error importing {file_path}: {e}")
+        
+        if not rows:
+            self.status_label.configure(text="")
+            return
+        
+        # Insert every file in one transaction, on the database thread
+        insert = database.query_async(database.add_books_bulk, rows)
+        self.after(IMPORT_POLL_MS, self._poll_insert, insert, kind)
+    
+    def _poll_insert(self, insert, kind: str):
+        """Report the imported books once the insert has finished (Tk thread only)."""
+        if not insert.done():
+            self.after(IMPORT_POLL_MS, self._poll_insert, insert, kind)
+            return
+        
+        try:
+            imported = insert.result()
+        except Exception as e:
+            self._show_import_error(kind, e)
+            return
+        if imported > 0:
+            self.status_label.configure(
+                text=f"✓ Successfully imported {imported} {kind} file(s)",
+                text_color=("#34C759", "#30D158")
+            )
+            self.on_import_complete()
+        else:
+            self.status_label.configure(text="")
+    
+    def _show_import_error(self, kind: str, error: Exception):
+        """Report an import that failed in the database, replacing the progress text."""
+        print(f"Error importing {kind} files: {error}")
+        self.status_label.configure(
+            text=f"Could not import {kind} file(s): {error}",
+            text_color=("#FF3B30", "#FF453A")
         )